@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""Configures the in-process caches of ``libactivitypub``.
+"""
+
+import logging
+import os
+from libactivitypub.activity import RESOLVED_OBJECTS
+from libactivitypub.actor import RESOLVED_ACTORS
+
+
+LOGGER = logging.getLogger('libmumble.caches')
+
+
+def configure_caches():
+    """Configures the caches of resolved objects and actors with environment
+    variables.
+
+    You may configure the following optional environment variables:
+    * ``MUMBLE_OBJECT_CACHE_SIZE``: maximum number of resolved objects to
+      cache. 1024 by default.
+    * ``MUMBLE_OBJECT_CACHE_TTL``: time to live of a resolved object in
+      seconds. 300 by default.
+    * ``MUMBLE_ACTOR_CACHE_SIZE``: maximum number of resolved actors to cache.
+      2048 by default.
+    * ``MUMBLE_ACTOR_CACHE_TTL``: time to live of a resolved actor in seconds.
+      3600 by default.
+
+    :raises ValueError: if any of the environment variables is invalid.
+    """
+    object_cache_size = int(os.environ.get('MUMBLE_OBJECT_CACHE_SIZE', '1024'))
+    object_cache_ttl = float(os.environ.get('MUMBLE_OBJECT_CACHE_TTL', '300'))
+    actor_cache_size = int(os.environ.get('MUMBLE_ACTOR_CACHE_SIZE', '2048'))
+    actor_cache_ttl = float(os.environ.get('MUMBLE_ACTOR_CACHE_TTL', '3600'))
+    LOGGER.debug(
+        'configuring object cache: size=%d, ttl=%f',
+        object_cache_size,
+        object_cache_ttl,
+    )
+    RESOLVED_OBJECTS.configure(object_cache_size, object_cache_ttl)
+    LOGGER.debug(
+        'configuring actor cache: size=%d, ttl=%f',
+        actor_cache_size,
+        actor_cache_ttl,
+    )
+    RESOLVED_ACTORS.configure(actor_cache_size, actor_cache_ttl)
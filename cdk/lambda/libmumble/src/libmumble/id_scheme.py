@@ -11,7 +11,6 @@ from uuid6 import uuid7
 
 
 LOGGER = logging.getLogger('libmumble.id_scheme')
-LOGGER.setLevel(logging.DEBUG)
 
 
 def make_user_id(domain_name: str, username: str) -> str:
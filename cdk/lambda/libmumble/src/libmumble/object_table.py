@@ -38,7 +38,6 @@ from .utils import (
 
 
 LOGGER = logging.getLogger('libmumble.object_table')
-LOGGER.setLevel(logging.DEBUG)
 
 
 class ObjectTable(TableWrapper):
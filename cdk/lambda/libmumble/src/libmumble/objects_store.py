@@ -3,6 +3,7 @@
 """Provides utilities around the objects store.
 """
 
+from contextlib import closing
 import json
 import logging
 import re
@@ -10,6 +11,7 @@ from typing import Any, Dict, Tuple, TypedDict
 from libactivitypub.activity import Activity
 from libactivitypub.data_objects import Note
 from libactivitypub.objects import DictObject
+import orjson
 from .exceptions import NotFoundError
 from .id_scheme import (
     generate_unique_part,
@@ -19,7 +21,6 @@ from .id_scheme import (
 
 
 LOGGER = logging.getLogger('libmumble.objects_store')
-LOGGER.setLevel(logging.DEBUG)
 
 
 class ObjectKey(TypedDict):
@@ -36,10 +37,12 @@ def dict_as_object_key(d: Dict[str, Any]) -> ObjectKey: # pylint: disable=invali
 
     :raises TypeError: if ``d`` is incompatible with ``ObjectKey``.
     """
-    if not isinstance(d.get('bucket'), str):
-        raise TypeError(f'"bucket" must be str but ${type(d.get("bucket"))}')
-    if not isinstance(d.get('key'), str):
-        raise TypeError(f'"key" must be str but ${type(d.get("key"))}')
+    bucket = d.get('bucket')
+    if not isinstance(bucket, str):
+        raise TypeError(f'"bucket" must be str but {type(bucket)}')
+    key = d.get('key')
+    if not isinstance(key, str):
+        raise TypeError(f'"key" must be str but {type(key)}')
     # unfortunately, above checks cannot convince d is ObjectKey
     return d # type: ignore
 
@@ -162,10 +165,10 @@ def load_json(s3_client, object_key: ObjectKey) -> Dict[str, Any]:
         )
     except s3_client.exceptions.NoSuchKey as exc:
         raise NotFoundError(f'no such object: {object_key}') from exc
-    body = res['Body']
-    data = body.read()
-    body.close()
-    return json.loads(data.decode('utf-8'))
+    # orjson directly parses bytes without decoding them into str.
+    # the buffer is released as soon as it is parsed.
+    with closing(res['Body']) as body:
+        return orjson.loads(body.read())
 
 
 def load_object(s3_client, object_key: ObjectKey) -> DictObject:
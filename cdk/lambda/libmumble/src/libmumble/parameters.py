@@ -4,12 +4,28 @@
 Manager.
 """
 
+from functools import lru_cache
 import logging
 import os
+import boto3
+from botocore.config import Config
 
 
 LOGGER = logging.getLogger('libmumble.parameters')
-LOGGER.setLevel(logging.DEBUG)
+
+SSM_CONFIG = Config(
+    connect_timeout=1,
+    read_timeout=2,
+    retries={
+        'max_attempts': 2,
+    },
+)
+"""Configuration of the AWS Systems Manager client that
+``get_cached_domain_name`` uses.
+
+Fails fast instead of waiting for the default 60 seconds, so that a stalled
+request to Parameter Store does not eat up the timeout of a Lambda function.
+"""
 
 
 def get_domain_name(ssm) -> str:
@@ -37,3 +53,23 @@ def get_domain_name(ssm) -> str:
         ssm.exceptions.ParameterNotFound,
     ) as exc:
         raise KeyError(exc) from exc
+
+
+@lru_cache(maxsize=1)
+def get_cached_domain_name() -> str:
+    """Obtains the domain name from Parameter Store on AWS Systems Manager
+    only on the first call.
+
+    Subsequent calls return the same domain name without any request, as long
+    as the Lambda container is reused.
+    Lambda functions should call this function when they need the domain name
+    instead of calling ``get_domain_name`` at import, so that a cold start
+    does not wait for Parameter Store.
+
+    You have to configure the following environment variable:
+    * ``DOMAIN_NAME_PARAMETER_PATH``
+
+    :raises KeyError: if the environement variable is not configured,
+    or if the domain name parameter is not found in Parameter Store.
+    """
+    return get_domain_name(boto3.client('ssm', config=SSM_CONFIG))
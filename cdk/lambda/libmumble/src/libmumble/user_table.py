@@ -36,7 +36,6 @@ from .utils import current_yyyymmdd_hhmmss_ssssss, parse_yyyymmdd_hhmmss_ssssss
 
 
 LOGGER = logging.getLogger('libmumble.user_table')
-LOGGER.setLevel(logging.DEBUG)
 
 
 class User: # pylint: disable=too-many-instance-attributes
@@ -362,6 +361,10 @@ class UserTable(TableWrapper):
     ) -> Optional[User]:
         """Finds a user associated with a given username.
 
+        The partition key of a user is derived from the username, so this
+        method gets the user item by its primary key with a single
+        ``GetItem`` request; i.e., neither scans nor queries the table.
+
         :param Optional[str] domain_name: domain name of the user. a returned
         user object becomes domain-agnostic if omitted.
 
@@ -390,6 +393,26 @@ class UserTable(TableWrapper):
                 f'invalid user data: "{username}"',
             ) from exc
 
+    def user_exists(self, username: str) -> bool:
+        """Returns if a user associated with a given username exists.
+
+        Lighter than ``find_user_by_username``, because only the partition
+        key of the user item is retrieved.
+
+        :raises TooManyAccessError: if access to the DynamoDB table exceeds the
+        limit.
+        """
+        try:
+            key = UserTable.make_user_key(username)
+            res = self._table.get_item(Key=key, ProjectionExpression='pk')
+        except self.ProvisionedThroughputExceededException as exc:
+            raise TooManyAccessError(
+                'exceeded provisioned table throughput',
+            ) from exc
+        except self.RequestLimitExceeded as exc:
+            raise TooManyAccessError('exceeded API access limit') from exc
+        return 'Item' in res
+
     def add_user_follower(self, username: str, follow: Follow):
         """Adds a follower of a given user.
 
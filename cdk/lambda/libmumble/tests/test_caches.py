@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""Tests ``libmumble.caches``.
+"""
+
+from libactivitypub.activity import RESOLVED_OBJECTS
+from libactivitypub.actor import RESOLVED_ACTORS
+from libmumble.caches import configure_caches
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def restore_caches():
+    """Restores the configuration of the caches after each test.
+    """
+    objects = (RESOLVED_OBJECTS.max_size, RESOLVED_OBJECTS.ttl)
+    actors = (RESOLVED_ACTORS.max_size, RESOLVED_ACTORS.ttl)
+    yield
+    RESOLVED_OBJECTS.configure(*objects)
+    RESOLVED_ACTORS.configure(*actors)
+
+
+def test_configure_caches_with_defaults(monkeypatch):
+    """Tests ``configure_caches`` without environment variables.
+    """
+    monkeypatch.delenv('MUMBLE_OBJECT_CACHE_SIZE', raising=False)
+    monkeypatch.delenv('MUMBLE_OBJECT_CACHE_TTL', raising=False)
+    monkeypatch.delenv('MUMBLE_ACTOR_CACHE_SIZE', raising=False)
+    monkeypatch.delenv('MUMBLE_ACTOR_CACHE_TTL', raising=False)
+    configure_caches()
+    assert RESOLVED_OBJECTS.max_size == 1024
+    assert RESOLVED_OBJECTS.ttl == 300.0
+    assert RESOLVED_ACTORS.max_size == 2048
+    assert RESOLVED_ACTORS.ttl == 3600.0
+
+
+def test_configure_caches_with_environment_variables(monkeypatch):
+    """Tests ``configure_caches`` with environment variables.
+    """
+    monkeypatch.setenv('MUMBLE_OBJECT_CACHE_SIZE', '10')
+    monkeypatch.setenv('MUMBLE_OBJECT_CACHE_TTL', '60')
+    monkeypatch.setenv('MUMBLE_ACTOR_CACHE_SIZE', '20')
+    monkeypatch.setenv('MUMBLE_ACTOR_CACHE_TTL', '120.5')
+    configure_caches()
+    assert RESOLVED_OBJECTS.max_size == 10
+    assert RESOLVED_OBJECTS.ttl == 60.0
+    assert RESOLVED_ACTORS.max_size == 20
+    assert RESOLVED_ACTORS.ttl == 120.5
+
+
+def test_configure_caches_with_invalid_size(monkeypatch):
+    """Tests ``configure_caches`` with an invalid cache size.
+    """
+    monkeypatch.setenv('MUMBLE_OBJECT_CACHE_SIZE', '0')
+    with pytest.raises(ValueError):
+        configure_caches()
@@ -9,6 +9,10 @@ You have to specify the following environment variables:
   name in Parameter Store on AWS Systems Manager.
 * ``QUARANTINE_BUCKET_NAME``: name of the S3 bucket that stores quarantined
   payloads.
+* ``LOG_LEVEL``: (optional) level of logs. "INFO" by default.
+* ``MUMBLE_OBJECT_CACHE_SIZE``, ``MUMBLE_OBJECT_CACHE_TTL``,
+  ``MUMBLE_ACTOR_CACHE_SIZE``, ``MUMBLE_ACTOR_CACHE_TTL``: (optional) sizes
+  and time to live (seconds) of caches. See ``libmumble.caches``.
 """
 
 import base64
@@ -16,15 +20,17 @@ import hashlib
 import json
 import logging
 import os
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 import boto3
 from libactivitypub.activity import Activity, Delete
-from libactivitypub.actor import Actor
+from libactivitypub.actor import Actor, PublicKey
 from libactivitypub.signature import (
+    Signature,
     VerificationError,
     parse_signature,
     verify_signature_and_headers,
 )
+from libmumble.caches import configure_caches
 from libmumble.exceptions import (
     BadRequestError,
     NotFoundError,
@@ -36,11 +42,17 @@ from libmumble.utils import current_yyyymmdd_hhmmss_ssssss, to_urlsafe_base64
 import requests
 
 
+# log level; e.g., "DEBUG". "INFO" by default so that debug logs cost nothing.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+
 LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
-# turns on logs from some dependencies
-logging.getLogger('libactivitypub').setLevel(logging.DEBUG)
-logging.getLogger('libmumble').setLevel(logging.DEBUG)
+LOGGER.setLevel(LOG_LEVEL)
+# applies the same level to logs from some dependencies
+logging.getLogger('libactivitypub').setLevel(LOG_LEVEL)
+logging.getLogger('libmumble').setLevel(LOG_LEVEL)
+
+# sizes and time to live of caches of resolved actors and objects
+configure_caches()
 
 PREFILTER_BODY_SIZE = 10 * 1024 # 10 KB
 
@@ -137,6 +149,71 @@ def prefilter_activity(body: str) -> Tuple[Optional[str], Optional[Activity]]:
     return None, activity
 
 
+def resolve_signer(
+    signature: Signature,
+    event: Dict[str, Any],
+    refresh: bool=False,
+) -> Tuple[Actor, PublicKey]:
+    """Resolves the signer of a given signature and its public key.
+
+    Quarantines ``event`` if the signer is unavailable or invalid.
+
+    :param bool refresh: requests the signer again even if it is cached.
+
+    :raises UnauthorizedError: if the signer cannot be resolved,
+    or if the signer is invalid.
+    """
+    LOGGER.debug('resolving signer: %s', signature['key_id'])
+    try:
+        signer = Actor.resolve_uri(signature['key_id'], refresh=refresh)
+    except requests.HTTPError as exc:
+        quarantine('bad_signer', event)
+        raise UnauthorizedError(
+            f'failed to resolve signer: {signature["key_id"]}',
+        ) from exc
+    except ValueError as exc:
+        quarantine('bad_signer_format', event)
+        raise UnauthorizedError(f'invalid actor: {exc}') from exc
+
+    LOGGER.debug('loading public key')
+    try:
+        public_key = signer.public_key
+    except (AttributeError, TypeError) as exc:
+        quarantine('bad_signer_format', event, signer.to_dict())
+        raise UnauthorizedError(f'invalid actor: {exc}') from exc
+    if public_key['id'] != signature['key_id']:
+        quarantine('bad_signer_format', event, signer.to_dict())
+        raise UnauthorizedError(f'key ID mismatch: {signature["key_id"]}')
+    return signer, public_key
+
+
+def verify_signature(
+    signature: Signature,
+    public_key: PublicKey,
+    event: Dict[str, Any],
+):
+    """Verifies a given signature of the request in ``event``.
+
+    :raises KeyError: if ``event`` lacks a signed header value.
+
+    :raises ValueError: if the signature is malformed.
+
+    :raises VerificationError: if the signature does not match.
+    """
+    verify_signature_and_headers(
+        signature,
+        public_key['publicKeyPem'],
+        header_values={
+            '(request-target)': f'post /users/{event["username"]}/inbox',
+            'body': event['body'],
+            'host': DOMAIN_NAME,
+            'date': event['date'],
+            'digest': event['digest'],
+            'content-type': event['contentType'],
+        },
+    )
+
+
 def lambda_handler(event, _context):
     """Runs on AWS Lambda.
 
@@ -192,46 +269,21 @@ def lambda_handler(event, _context):
         quarantine('bad_signature', event)
         raise UnauthorizedError(f'bad signature: {exc}') from exc
 
-    LOGGER.debug('resolving signer: %s', signature['key_id'])
-    try:
-        signer = Actor.resolve_uri(signature['key_id'])
-    except requests.HTTPError as exc:
-        quarantine('bad_signer', event)
-        raise UnauthorizedError(
-            f'failed to resolve signer: {signature["key_id"]}',
-        ) from exc
-    except ValueError as exc:
-        quarantine('bad_signer_format', event)
-        raise UnauthorizedError(f'invalid actor: {exc}') from exc
-
-    LOGGER.debug('loading public key')
-    try:
-        public_key = signer.public_key
-    except (AttributeError, TypeError) as exc:
-        quarantine('bad_signer_format', event, signer.to_dict())
-        raise UnauthorizedError(f'invalid actor: {exc}') from exc
-    if public_key['id'] != signature['key_id']:
-        quarantine('bad_signer_format', event, signer.to_dict())
-        raise UnauthorizedError(f'key ID mismatch: {signature["key_id"]}')
+    signer, public_key = resolve_signer(signature, event)
 
     LOGGER.debug('verifying signature')
-    body = event['body']
     try:
-        verify_signature_and_headers(
-            signature,
-            public_key['publicKeyPem'],
-            header_values={
-                '(request-target)': f'post /users/{username}/inbox',
-                'body': body,
-                'host': DOMAIN_NAME,
-                'date': event['date'],
-                'digest': event['digest'],
-                'content-type': event['contentType'],
-            },
-        )
+        try:
+            verify_signature(signature, public_key, event)
+        except VerificationError:
+            # the cached signer may be out of date if it has rotated the key
+            LOGGER.debug('verifying signature with refreshed signer')
+            signer, public_key = resolve_signer(signature, event, refresh=True)
+            verify_signature(signature, public_key, event)
     except (KeyError, ValueError, VerificationError) as exc:
         quarantine('invalid_signature', event)
         raise UnauthorizedError(f'failed to authenticate: {exc}') from exc
+    body = event['body']
 
     # once the signature is verified, we can parse the body
     if activity is None:
@@ -9,7 +9,6 @@ You have to specify the following environment variable:
   name in Parameter Store on AWS Systems Manager.
 """
 
-import json
 import logging
 import os
 import re
@@ -25,6 +24,7 @@ from libmumble.exceptions import (
 from libmumble.objects_store import dict_as_object_key, load_activity
 from libmumble.parameters import get_domain_name
 from libmumble.user_table import UserTable, parse_user_id
+import orjson
 import requests
 
 
@@ -98,7 +98,7 @@ def lambda_handler(event, _context):
         LOGGER.debug('sending activity')
         res = activity_streams_post(
             recipient,
-            body=json.dumps(activity.to_dict()).encode('utf-8'),
+            body=orjson.dumps(activity.to_dict()),
             private_key={
                 'key_id': user.key_id,
                 'private_key_pem': user.get_private_key(boto3.client('ssm')),
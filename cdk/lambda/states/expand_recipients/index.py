@@ -8,6 +8,9 @@ You have to specify the following environment variable:
 * ``USER_TABLE_NAME``: name of the DynamoDB table that stores user information.
 * ``DOMAIN_NAME_PARAMETER_PATH``: path to the parameter storing the domain name
   in Parameter Store on AWS Systems Manager.
+* ``MUMBLE_OBJECT_CACHE_SIZE``, ``MUMBLE_OBJECT_CACHE_TTL``,
+  ``MUMBLE_ACTOR_CACHE_SIZE``, ``MUMBLE_ACTOR_CACHE_TTL``: (optional) sizes
+  and time to live (seconds) of caches. See ``libmumble.caches``.
 """
 
 import logging
@@ -20,6 +23,7 @@ from libactivitypub.activity_streams import ACTIVITY_STREAMS_PUBLIC_ADDRESS
 from libactivitypub.actor import Actor
 from libactivitypub.data_objects import COLLECTION_TYPES
 from libactivitypub.objects import DictObject
+from libmumble.caches import configure_caches
 from libmumble.parameters import get_domain_name
 from libmumble.exceptions import (
     BadConfigurationError,
@@ -40,6 +44,9 @@ import requests
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 
+# sizes and time to live of caches of resolved actors and objects
+configure_caches()
+
 OBJECTS_BUCKET_NAME = os.environ['OBJECTS_BUCKET_NAME']
 
 USER_TABLE_NAME = os.environ['USER_TABLE_NAME']
@@ -10,8 +10,10 @@ You have to specify the following environment variable:
 * ``OBJECTS_BUCKET_NAME``: name of the S3 bucket that stores activity objects.
 * ``DOMAIN_NAME_PARAMETER_PATH``: path to the parameter containing the domain
   name in Parameter Store on AWS Systems Manager.
+* ``LOG_LEVEL``: (optional) level of logs. "INFO" by default.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 from typing import Optional
@@ -38,20 +40,22 @@ from libmumble.objects_store import (
     load_activity,
     save_object,
 )
-from libmumble.parameters import get_domain_name
+from libmumble.parameters import get_cached_domain_name
 from libmumble.user_table import User, UserTable
 import requests
 
 
-LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
-# turns on logs from some dependencies
-logging.getLogger('libactivitypub').setLevel(logging.DEBUG)
-logging.getLogger('libmumble').setLevel(logging.DEBUG)
+# log level; e.g., "DEBUG". "INFO" by default so that debug logs cost nothing.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 
-DOMAIN_NAME = get_domain_name(boto3.client('ssm'))
+LOGGER = logging.getLogger(__name__)
+LOGGER.setLevel(LOG_LEVEL)
+# applies the same level to logs from some dependencies
+logging.getLogger('libactivitypub').setLevel(LOG_LEVEL)
+logging.getLogger('libmumble').setLevel(LOG_LEVEL)
 
 OBJECTS_BUCKET_NAME = os.environ['OBJECTS_BUCKET_NAME']
+S3_CLIENT = boto3.client('s3')
 
 USER_TABLE_NAME = os.environ['USER_TABLE_NAME']
 USER_TABLE = UserTable(boto3.resource('dynamodb').Table(USER_TABLE_NAME))
@@ -59,13 +63,14 @@ USER_TABLE = UserTable(boto3.resource('dynamodb').Table(USER_TABLE_NAME))
 OBJECT_TABLE_NAME = os.environ['OBJECT_TABLE_NAME']
 OBJECT_TABLE = ObjectTable(boto3.resource('dynamodb').Table(OBJECT_TABLE_NAME))
 
-
 class ActivityTranslator(ActivityVisitor):
     """``ActivityVistor`` that translates an activity.
     """
+    __slots__ = ('user', 'response')
+
     user: User
     """Inbox owner user."""
-    response: Optional[ResponseActivity]=None
+    response: Optional[ResponseActivity]
     """Optional response to the translated activity.
     ``None`` if there is no response.
     """
@@ -74,6 +79,7 @@ class ActivityTranslator(ActivityVisitor):
         """Initializes with an inbox owner user.
         """
         self.user = user
+        self.response = None
 
     def visit_create(self, create: Create):
         """Translates a "Create" activity.
@@ -142,7 +148,8 @@ class ActivityTranslator(ActivityVisitor):
         :raises requests.HTTPError: if a request to the remote server fails
         with a non-transient error.
         """
-        LOGGER.debug('translating Follow: %s', follow.to_dict())
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('translating Follow: %s', follow.to_dict())
         USER_TABLE.add_user_follower(self.user.username, follow)
         self.response = Accept.create(
             actor_id=follow.followed_id,
@@ -162,7 +169,8 @@ class ActivityTranslator(ActivityVisitor):
 
         :raises TooManyAccessError: if there are too many requests.
         """
-        LOGGER.debug('translating Undo: %s', undo.to_dict())
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('translating Undo: %s', undo.to_dict())
         undoer = Undoer(self.user)
         activity = undo.resolve_undone_activity()
         activity.visit(undoer)
@@ -171,6 +179,8 @@ class ActivityTranslator(ActivityVisitor):
 class Undoer(ActivityVisitor):
     """``ActivityVisitor`` that undoes an activity.
     """
+    __slots__ = ('user',)
+
     user: User
     """Username of the inbox owner."""
 
@@ -186,10 +196,22 @@ class Undoer(ActivityVisitor):
 
         :raises TooManyAccessError: if there are too many requests.
         """
-        LOGGER.debug('undoing Follow: %s', follow.to_dict())
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('undoing Follow: %s', follow.to_dict())
         USER_TABLE.remove_user_follower(self.user.username, follow)
 
 
+def find_inbox_owner(username: str) -> Optional[User]:
+    """Looks up the owner of an inbox.
+
+    :returns: ``None`` if no user is associated with ``username``.
+
+    :raises TooManyAccessError: if access to the DynamoDB table exceeds the
+    limit.
+    """
+    return USER_TABLE.find_user_by_username(username, get_cached_domain_name())
+
+
 def translate_activity(activity: Activity, user: User):
     """Translates a given activity.
 
@@ -205,9 +227,13 @@ def translate_activity(activity: Activity, user: User):
         translator = ActivityTranslator(user)
         activity.visit(translator)
         if translator.response is not None:
-            LOGGER.debug('saving response: %s', translator.response.to_dict())
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    'saving response: %s',
+                    translator.response.to_dict(),
+                )
             save_object(
-                boto3.client('s3'),
+                S3_CLIENT,
                 {
                     'bucket': OBJECTS_BUCKET_NAME,
                     'key': user.generate_staging_outbox_key(),
@@ -262,11 +288,16 @@ def lambda_handler(event, _context):
             f' {OBJECTS_BUCKET_NAME} vs {object_key["bucket"]}',
         )
     username = get_username_from_inbox_key(object_key['key'])
-    LOGGER.debug('looking up user: %s', username)
-    user = USER_TABLE.find_user_by_username(username, DOMAIN_NAME)
-    if user is None:
-        raise NotFoundError(f'no such user: {username}')
-    LOGGER.debug('loading activity: %s', object_key)
-    activity = load_activity(boto3.client('s3'), object_key)
-    LOGGER.debug('translating activity: %s', activity.to_dict())
+    # the user and activity are independent of each other
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        LOGGER.debug('looking up user: %s', username)
+        user_future = executor.submit(find_inbox_owner, username)
+        LOGGER.debug('loading activity: %s', object_key)
+        activity_future = executor.submit(load_activity, S3_CLIENT, object_key)
+        user = user_future.result()
+        if user is None:
+            raise NotFoundError(f'no such user: {username}')
+        activity = activity_future.result()
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug('translating activity: %s', activity.to_dict())
     translate_activity(activity, user)
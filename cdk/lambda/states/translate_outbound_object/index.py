@@ -7,6 +7,7 @@ You have to specify the following environment variables:
 * ``USER_TABLE_NAME``: name of the DynamoDB table that stores user information.
 * ``DOMAIN_NAME_PARAMETER_PATH``: path to the parameter storing the domain name
   in Parameter Store on AWS Systems Manager.
+* ``LOG_LEVEL``: (optional) level of logs. "INFO" by default.
 """
 
 import logging
@@ -17,7 +18,7 @@ from libactivitypub.activity_streams import ACTIVITY_STREAMS_CONTEXT
 from libactivitypub.data_objects import Note
 from libactivitypub.objects import DictObject
 from libmumble.exceptions import BadConfigurationError, NotFoundError
-from libmumble.parameters import get_domain_name
+from libmumble.parameters import get_cached_domain_name
 from libmumble.objects_store import (
     dict_as_object_key,
     get_username_from_staging_outbox_key,
@@ -29,13 +30,14 @@ from libmumble.user_table import User, UserTable
 from libmumble.utils import current_yyyymmdd_hhmmss
 
 
-LOGGER = logging.getLogger(__name__)
-LOGGER.setLevel(logging.DEBUG)
-# turns on logs from some dependencies
-logging.getLogger('libactivitypub').setLevel(logging.DEBUG)
-logging.getLogger('libmumble').setLevel(logging.DEBUG)
+# log level; e.g., "DEBUG". "INFO" by default so that debug logs cost nothing.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 
-DOMAIN_NAME = get_domain_name(boto3.client('ssm'))
+LOGGER = logging.getLogger(__name__)
+LOGGER.setLevel(LOG_LEVEL)
+# applies the same level to logs from some dependencies
+logging.getLogger('libactivitypub').setLevel(LOG_LEVEL)
+logging.getLogger('libmumble').setLevel(LOG_LEVEL)
 
 OBJECTS_BUCKET_NAME = os.environ['OBJECTS_BUCKET_NAME']
 S3_CLIENT = boto3.client('s3')
@@ -114,12 +116,17 @@ def lambda_handler(event, _context):
         )
     username = get_username_from_staging_outbox_key(object_key['key'])
     LOGGER.debug('looking up user: %s', username)
-    user = USER_TABLE.find_user_by_username(username, DOMAIN_NAME)
+    user = USER_TABLE.find_user_by_username(
+        username,
+        get_cached_domain_name(),
+    )
     if user is None:
         raise NotFoundError(f'no such user: {username}')
     LOGGER.debug('loading object: %s', object_key)
     obj = load_object(S3_CLIENT, object_key)
-    LOGGER.debug('translating object: %s', obj.to_dict())
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug('translating object: %s', obj.to_dict())
     activity = translate_object(obj, user)
-    LOGGER.debug('staging activity: %s', activity.to_dict())
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug('staging activity: %s', activity.to_dict())
     save_activity_in_outbox(S3_CLIENT, OBJECTS_BUCKET_NAME, activity)
@@ -11,20 +11,28 @@ You have specify the following environment variables:
 import logging
 import os
 import boto3
+from libactivitypub.cache import TtlLruCache
 from libmumble.exceptions import BadConfigurationError, NotFoundError
 from libmumble.id_scheme import split_user_id
-from libmumble.parameters import get_domain_name
+from libmumble.parameters import get_cached_domain_name
 from libmumble.user_table import UserTable
 
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 
-DOMAIN_NAME = get_domain_name(boto3.client('ssm'))
-
 USER_TABLE_NAME = os.environ['USER_TABLE_NAME']
 USER_TABLE = UserTable(boto3.resource('dynamodb').Table(USER_TABLE_NAME))
 
+UPDATE_INTERVAL = 60.0 # minimum seconds between updates of the same user
+MAX_TRACKED_USERS = 1024 # maximum number of users in RECENTLY_UPDATED_USERS
+# users whose last activity was updated by this container within
+# UPDATE_INTERVAL seconds.
+RECENTLY_UPDATED_USERS: TtlLruCache[str, bool] = TtlLruCache(
+    max_size=MAX_TRACKED_USERS,
+    ttl=UPDATE_INTERVAL,
+)
+
 
 def lambda_handler(event, _context):
     """Runs on AWS Lambda.
@@ -52,11 +60,16 @@ def lambda_handler(event, _context):
     LOGGER.debug('updating last activity: %s', event)
     actor_id = event['actor']['id']
     domain_name, username, _ = split_user_id(actor_id)
-    if domain_name != DOMAIN_NAME:
+    own_domain_name = get_cached_domain_name()
+    if domain_name != own_domain_name:
         raise BadConfigurationError(
-            f'domain name mismatch: {DOMAIN_NAME} vs {domain_name}',
+            f'domain name mismatch: {own_domain_name} vs {domain_name}',
         )
-    user = USER_TABLE.find_user_by_username(username, DOMAIN_NAME)
+    if RECENTLY_UPDATED_USERS.get(username):
+        LOGGER.debug('skipping recently updated user: %s', username)
+        return
+    user = USER_TABLE.find_user_by_username(username, own_domain_name)
     if user is None:
         raise NotFoundError(f'no such user: {username}')
     user.update_last_activity()
+    RECENTLY_UPDATED_USERS.put(username, True)
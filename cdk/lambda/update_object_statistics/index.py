@@ -6,157 +6,118 @@ You have to specify the following environment variable:
 * ``OBJECT_TABLE_NAME``: name of the DynamoDB table that manages objects.
 """
 
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
-from typing import Any, Dict, Generator
+from typing import Any, Dict, Iterable
 import boto3
-from boto3.dynamodb.types import TypeDeserializer
-from libmumble.dynamodb import PrimaryKey, dict_as_primary_key
+from botocore.exceptions import ClientError
 from libmumble.object_table import ObjectTable
-from libmumble.utils import chunk
 
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 
-BATCH_SIZE = 25 # hard limit upon items in a single batch for DynamoDB
+MAX_WORKERS = 8 # maximum number of updates executed in parallel
 
 OBJECT_TABLE_NAME = os.environ['OBJECT_TABLE_NAME']
 OBJECT_TABLE = ObjectTable(boto3.resource('dynamodb').Table(OBJECT_TABLE_NAME))
 
-DESERIALIZER = TypeDeserializer()
+DYNAMODB_CLIENT = boto3.client('dynamodb')
 
+# parts of an `UpdateItem` request that are common among posts.
+# fails if the post does not exist, so that no orphan metadata is created.
+REPLY_COUNT_UPDATE_TEMPLATE = {
+    'TableName': OBJECT_TABLE_NAME,
+    'UpdateExpression': 'ADD replyCount :deltaReplyCount',
+    'ConditionExpression': 'attribute_exists(pk)',
+}
 
-def deserialize_key(value: Dict[str, Any]) -> Dict[str, Any]:
-    """Converts a given primary key partially represented in the DynamoDB
-    convention into the corresponding Python type.
-    """
-    return DESERIALIZER.deserialize({
-        'M': value,
-    })
-
-
-class Updates:
-    """Updates on statistics.
-    """
-    post_updates: Dict[str, 'PostUpdates']
-    """Maps a partition key of a post to the updates to the post."""
-        # DO NOT initialize it here. Otherwise, you will end up with infinite
-        # invocations because the updates in the previous call persist.
-
-    def __init__(self):
-        """Initializes an empty updates.
-        """
-        self.post_updates = {}
 
-    def process_record(self, record: Dict[str, Any]):
-        """Processes a given event record.
+def make_update_request(post_pk: str, delta_reply_count: int) -> Dict[str, Any]:
+    """Makes an ``UpdateItem`` request that adds a given number to the number
+    of replies to a post.
 
-        Does not actually update the database but accumulates the deltas added
-        to statistics.
-        Call ``execute`` to actually update the database.
+    Only the key and value are built per post; the rest is shared with
+    ``REPLY_COUNT_UPDATE_TEMPLATE``.
 
-        :raises TypeError: if the primary key is invalid.
-        """
+    :param str post_pk: partition key of the original post.
+    """
+    return {
+        **REPLY_COUNT_UPDATE_TEMPLATE,
+        'Key': {
+            'pk': { 'S': post_pk },
+            'sk': { 'S': 'metadata' },
+        },
+        'ExpressionAttributeValues': {
+            ':deltaReplyCount': { 'N': str(delta_reply_count) },
+        },
+    }
+
+
+def aggregate(records: Iterable[Dict[str, Any]]) -> Counter:
+    """Aggregates the numbers of replies added to posts in given event
+    records.
+
+    Scans ``records`` once, and counts +1 for each inserted reply and -1 for
+    each removed reply.
+    Prefixes of the raw primary key are tested before anything else is done,
+    because most records are not for replies.
+
+    :returns: ``Counter`` that maps a partition key of a post to the number
+    added to the number of replies to the post.
+    """
+    post_updates = Counter()
+    for record in records:
         event_name = record['eventName']
         if event_name == 'INSERT':
-            key = dict_as_primary_key(
-                deserialize_key(record['dynamodb']['Keys']),
-            )
-            self.process_insert(key)
+            delta = 1
         elif event_name == 'REMOVE':
-            key = dict_as_primary_key(
-                deserialize_key(record['dynamodb']['Keys']),
-            )
-            self.process_remove(key)
-        else:
-            LOGGER.debug('ignores event: %s', event_name)
-
-    def process_insert(self, key: PrimaryKey):
-        """Processes an "INSERT" event.
-        """
-        if key['pk'].startswith(ObjectTable.OBJECT_PK_PREFIX):
-            if key['sk'].startswith(ObjectTable.REPLY_SK_PREFIX):
-                self.add_reply_count(key, 1)
-            else:
-                LOGGER.debug('ignores other than post')
-        else:
-            LOGGER.debug('ignores non-object')
-
-    def process_remove(self, key: PrimaryKey):
-        """Processes a "REMOVE" event.
-        """
-        if key['pk'].startswith(ObjectTable.OBJECT_PK_PREFIX):
-            if key['sk'].startswith(ObjectTable.REPLY_SK_PREFIX):
-                self.add_reply_count(key, -1)
-            else:
-                LOGGER.debug('ignores other than post')
+            delta = -1
         else:
-            LOGGER.debug('ignores non-object')
-
-    def add_reply_count(self, key: PrimaryKey, delta: int):
-        """Adds a given number to the numbrer of replies to the original post.
-        """
-        LOGGER.debug('adding reply: key=%s, delta=%d', key, delta)
-        post_pk = key['pk']
-        if post_pk not in self.post_updates:
-            self.post_updates[post_pk] = PostUpdates(post_pk)
-        self.post_updates[post_pk].delta_reply_count += delta
-
-    def execute(self):
-        """Executes the updates.
-        """
-        dynamodb = boto3.client('dynamodb')
-        batches = chunk(self.enumerate_statements(), BATCH_SIZE)
-        for i, batch in enumerate(batches):
-            LOGGER.debug('executing batch [%d]: %s', i, batch)
-            res = dynamodb.batch_execute_statement(Statements=batch)
-            for j, res_item in enumerate(res['Responses']):
-                if 'Error' in res_item:
-                    LOGGER.error(
-                        'update error: error=%s, statement=%s',
-                        res_item['Error'],
-                        batch[j],
-                    )
-                    # TODO: we should not repeat processing.
-                    #       should we report error to SQS?
-
-    def enumerate_statements(self) -> Generator[Dict[str, Any], None, None]:
-        """Enumerates statements to update statistics.
-        """
-        for updates in self.post_updates.values():
-            yield updates.make_statement(OBJECT_TABLE_NAME)
-
-
-class PostUpdates: # pylint: disable=too-few-public-methods
-    """Updates on a post.
+            continue
+        keys = record['dynamodb']['Keys']
+        post_pk = keys['pk'].get('S', '')
+        if not post_pk.startswith(ObjectTable.OBJECT_PK_PREFIX):
+            continue
+        if not keys['sk'].get('S', '').startswith(ObjectTable.REPLY_SK_PREFIX):
+            continue
+        post_updates[post_pk] += delta
+    return post_updates
+
+
+def execute(post_updates: Counter):
+    """Executes updates aggregated by ``aggregate``.
+
+    Updates are independent of each other and executed in parallel.
+    Skips posts whose updates cancel out; e.g., a reply that is added and
+    removed in the same batch of records.
     """
-    post_pk: str
-    """Partition key of the original post."""
-    delta_reply_count: int = 0
-    """The number added to the number of replies."""
-
-    def __init__(self, post_pk: str):
-        """Initializes updates on a given post.
-
-        :param str post_pk: partition key of the original post.
-        """
-        self.post_pk = post_pk
-
-    def make_statement(self, table_name: str):
-        """Makes a PartiQL statement to execute the updates.
-        """
-        return {
-            'Statement': (
-                f'UPDATE "{table_name}"'
-                ' SET replyCount = replyCount + ?'
-                " WHERE pk = ? AND sk = 'metadata'"
-            ),
-            'Parameters': [
-                { 'N': str(self.delta_reply_count) },
-                { 'S': self.post_pk },
-            ],
-        }
+    requests = [
+        make_update_request(post_pk, delta_reply_count)
+            for post_pk, delta_reply_count in post_updates.items()
+            if delta_reply_count != 0
+    ]
+    if not requests:
+        LOGGER.debug('no updates to execute')
+        return
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(DYNAMODB_CLIENT.update_item, **request)
+                for request in requests
+        ]
+        for request, future in zip(requests, futures):
+            try:
+                future.result()
+            except ClientError as exc:
+                LOGGER.error(
+                    'update error: error=%s, request=%s',
+                    exc,
+                    request,
+                )
+                # TODO: we should not repeat processing.
+                #       should we report error to SQS?
 
 
 def lambda_handler(event, _context):
@@ -165,8 +126,6 @@ def lambda_handler(event, _context):
     ``event`` must be from DynamoDB stream.
     """
     LOGGER.debug('collecting statistics: %s', event)
-    updates = Updates()
-    for record in event['Records']:
-        updates.process_record(record)
-    LOGGER.debug('updating statisitcs')
-    updates.execute()
+    post_updates = aggregate(event['Records'])
+    LOGGER.debug('updating statisitcs: %s', post_updates)
+    execute(post_updates)
@@ -6,11 +6,14 @@ You have to specify the following environment variable:
 * ``USER_TABLE_NAME``: name of the DynamoDB table that manages user information.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
-from typing import Any, Dict, Generator
+from typing import Any, Dict
 import boto3
 from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from libmumble.dynamodb import PrimaryKey, dict_as_primary_key
 from libmumble.user_table import (
     UserTable,
@@ -18,30 +21,63 @@ from libmumble.user_table import (
     parse_followee_partition_key,
     parse_follower_partition_key,
 )
-from libmumble.utils import chunk
 
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 
-BATCH_SIZE = 25 # hard limit upon items in a single batch of DynamoDB
+MAX_WORKERS = 8 # maximum number of updates executed in parallel
 
 USER_TABLE_NAME = os.environ['USER_TABLE_NAME']
 
 DESERIALIZER = TypeDeserializer()
 
+# keeps idle connections to DynamoDB alive between updates.
+# throttled updates are retried with exponential backoff, and the adaptive
+# mode slows down the client while DynamoDB is throttling it.
+DYNAMODB_CONFIG = Config(
+    tcp_keepalive=True,
+    retries={
+        'mode': 'adaptive',
+        'max_attempts': 5,
+    },
+)
+
+DYNAMODB_CLIENT = boto3.client('dynamodb', config=DYNAMODB_CONFIG)
+
+# parts of an `UpdateItem` request that are common among users.
+# fails if the user does not exist, so that no orphan user is created.
+USER_STATISTICS_UPDATE_TEMPLATE = {
+    'TableName': USER_TABLE_NAME,
+    'UpdateExpression': (
+        'ADD followerCount :deltaFollowerCount,'
+        ' followingCount :deltaFolloweeCount'
+    ),
+    'ConditionExpression': 'attribute_exists(pk)',
+}
+
 
 def deserialize_primary_key(key: Dict[str, Any]) -> PrimaryKey:
     """Converts a given primary key in a DynamoDB stream event into
     ``PrimaryKey``.
 
+    Key attributes of the user table are strings, so this function takes
+    their "S" values directly.
+    Falls back to ``TypeDeserializer`` only if ``key`` has another shape.
+
     :raises TypeError: if ``key`` is not a valid user table primary key.
     """
-    return dict_as_primary_key(
-        DESERIALIZER.deserialize({
-            'M': key,
-        }),
-    )
+    try:
+        return {
+            'pk': key['pk']['S'],
+            'sk': key['sk']['S'],
+        }
+    except KeyError:
+        return dict_as_primary_key(
+            DESERIALIZER.deserialize({
+                'M': key,
+            }),
+        )
 
 
 class UserUpdates: # pylint: disable=too-few-public-methods
@@ -49,6 +85,8 @@ class UserUpdates: # pylint: disable=too-few-public-methods
     """
     username: str
     """Username."""
+    key: Dict[str, Any]
+    """Primary key of the user in the DynamoDB convention."""
     delta_follower_count: int = 0
     """Number added to the number of followers of the user."""
     delta_followee_count: int = 0
@@ -58,29 +96,42 @@ class UserUpdates: # pylint: disable=too-few-public-methods
         """Initializes with a username.
         """
         self.username = username
+        self.key = {
+            'pk': { 'S': make_user_partition_key(username) },
+            'sk': { 'S': 'reserved' },
+        }
+
+    def make_update_request(self) -> Dict[str, Any]:
+        """Makes an ``UpdateItem`` request to execute the updates.
 
-    def make_statement(self, table_name: str):
-        """Makes a PartiQL statement to execute the updates.
+        Only the key and values are built per user; the rest is shared with
+        ``USER_STATISTICS_UPDATE_TEMPLATE``.
         """
         return {
-            'Statement': (
-                f'UPDATE "{table_name}"'
-                ' SET followerCount = followerCount + ?'
-                ' SET followingCount = followingCount + ?'
-                " WHERE pk = ? AND sk = 'reserved'"
-            ),
-            'Parameters': [
-                { 'N': str(self.delta_follower_count) },
-                { 'N': str(self.delta_followee_count) },
-                { 'S': make_user_partition_key(self.username) },
-            ],
+            **USER_STATISTICS_UPDATE_TEMPLATE,
+            'Key': self.key,
+            'ExpressionAttributeValues': {
+                ':deltaFollowerCount': { 'N': str(self.delta_follower_count) },
+                ':deltaFolloweeCount': { 'N': str(self.delta_followee_count) },
+            },
         }
 
 
+class UserUpdatesMap(Dict[str, UserUpdates]):
+    """``dict`` that maps a username to accumulated updates.
+
+    Initializes an empty updates object for a missing username on access.
+    """
+    def __missing__(self, username: str) -> UserUpdates:
+        updates = UserUpdates(username)
+        self[username] = updates
+        return updates
+
+
 class Updates:
     """Updates on the user table.
     """
-    user_updates: Dict[str, UserUpdates]
+    user_updates: UserUpdatesMap
     """Maps a username to accumulated updates."""
         # DO NOT initialize it here. Otherwise, you will end up with infinite
         # invocations because the updates are accumulated over different calls.
@@ -88,15 +139,13 @@ class Updates:
     def __init__(self):
         """Initializes an empty updates.
         """
-        self.user_updates = {}
+        self.user_updates = UserUpdatesMap()
 
     def get_user_updates(self, username: str) -> UserUpdates:
         """Returns the updates object for a given user.
 
         Initializes an empty object if there is no updates object for the user.
         """
-        if username not in self.user_updates:
-            self.user_updates[username] = UserUpdates(username)
         return self.user_updates[username]
 
     def process_record(self, record: Dict[str, Any]):
@@ -105,45 +154,27 @@ class Updates:
         Does not actually updates the database but accumulates updates.
         Call ``execute`` to update the database.
 
+        "INSERT" increments and "REMOVE" decrements the count chosen by the
+        prefix of the partition key through ``COUNT_UPDATERS``.
+
         :raises TypeError: if the key is not a valid user table primary key.
         """
         event_name = record['eventName']
         if event_name == 'INSERT':
-            self.process_insert(
-                deserialize_primary_key(record['dynamodb']['Keys']),
-            )
+            delta = 1
         elif event_name == 'REMOVE':
-            self.process_remove(
-                deserialize_primary_key(record['dynamodb']['Keys']),
-            )
+            delta = -1
         else:
             LOGGER.debug('ignores event: %s', event_name)
-
-    def process_insert(self, key: PrimaryKey):
-        """Processes an "INSERT" event.
-        """
+            return
+        key = deserialize_primary_key(record['dynamodb']['Keys'])
         pk = key['pk'] # pylint: disable=invalid-name
-        if pk.startswith(UserTable.FOLLOWER_PK_PREFIX):
-            LOGGER.debug('incrementing follower')
-            self.add_follower_count(key, 1)
-        elif pk.startswith(UserTable.FOLLOWEE_PK_PREFIX):
-            LOGGER.debug('incrementing followee')
-            self.add_followee_count(key, 1)
-        else:
-            LOGGER.debug('ignores key: %s', key)
-
-    def process_remove(self, key: PrimaryKey):
-        """Processes a "REMOVE" event.
-        """
-        pk = key['pk'] # pylint: disable=invalid-name
-        if pk.startswith(UserTable.FOLLOWER_PK_PREFIX):
-            LOGGER.debug('decrementing follower')
-            self.add_follower_count(key, -1)
-        elif pk.startswith(UserTable.FOLLOWEE_PK_PREFIX):
-            LOGGER.debug('decrementing followee')
-            self.add_followee_count(key, -1)
-        else:
+        # prefixes end with the first colon
+        update_count = Updates.COUNT_UPDATERS.get(pk[:pk.find(':') + 1])
+        if update_count is None:
             LOGGER.debug('ignores key: %s', key)
+            return
+        update_count(self, key, delta)
 
     def add_follower_count(self, key: PrimaryKey, delta: int):
         """Adds a given number to the follower count of a user.
@@ -161,30 +192,46 @@ class Updates:
         username = parse_followee_partition_key(key['pk'])
         self.get_user_updates(username).delta_followee_count += delta
 
+    COUNT_UPDATERS = {
+        UserTable.FOLLOWER_PK_PREFIX: add_follower_count,
+        UserTable.FOLLOWEE_PK_PREFIX: add_followee_count,
+    }
+    """Maps a partition key prefix to the method that updates the
+    corresponding count."""
+
     def execute(self):
         """Executes the accumulated updates.
+
+        Updates are independent of each other and executed in parallel.
+        Skips users whose updates cancel out; e.g., a follower that is added
+        and removed in the same batch of records.
         """
-        dynamodb = boto3.client('dynamodb')
-        batches = chunk(self.enumerate_statements(), BATCH_SIZE)
-        for i, batch in enumerate(batches):
-            LOGGER.debug('executing batch [%d]: %s', i, batch)
-            res = dynamodb.batch_execute_statement(Statements=batch)
-            for j, res_item in enumerate(res['Responses']):
-                if 'Error' in res_item:
+        requests = [
+            updates.make_update_request()
+                for updates in self.user_updates.values()
+                if updates.delta_follower_count != 0
+                    or updates.delta_followee_count != 0
+        ]
+        if not requests:
+            LOGGER.debug('no updates to execute')
+            return
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(DYNAMODB_CLIENT.update_item, **request)
+                    for request in requests
+            ]
+            for request, future in zip(requests, futures):
+                try:
+                    future.result()
+                except ClientError as exc:
                     LOGGER.error(
-                        'update error: error=%s, statement=%s',
-                        res_item['Error'],
-                        batch[j],
+                        'update error: error=%s, request=%s',
+                        exc,
+                        request,
                     )
                     # TODO: we should not retry execution.
                     #       should we report error to SQS?
 
-    def enumerate_statements(self) -> Generator[Dict[str, Any], None, None]:
-        """Enumerates statements to update statistics.
-        """
-        for updates in self.user_updates.values():
-            yield updates.make_statement(USER_TABLE_NAME)
-
 
 def lambda_handler(event, _context):
     """Runs on AWS Lambda.
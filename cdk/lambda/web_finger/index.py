@@ -10,24 +10,57 @@ You have to specify the following environment variables:
 
 import logging
 import os
+from typing import Optional
 import boto3
+from botocore.config import Config
+from libactivitypub.cache import TtlLruCache
 from libactivitypub.utils import parse_acct_uri
 from libmumble.exceptions import (
     BadRequestError,
     NotFoundError,
     UnexpectedDomainError,
 )
-from libmumble.parameters import get_domain_name
+from libmumble.id_scheme import make_user_id
+from libmumble.parameters import get_cached_domain_name
 from libmumble.user_table import UserTable
 
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 
-DOMAIN_NAME = get_domain_name(boto3.client('ssm'))
-
 USER_TABLE_NAME = os.environ['USER_TABLE_NAME']
-USER_TABLE = UserTable(boto3.resource('dynamodb').Table(USER_TABLE_NAME))
+# keeps idle connections to DynamoDB alive across warm invocations.
+DYNAMODB_CONFIG = Config(tcp_keepalive=True)
+USER_TABLE = UserTable(
+    boto3.resource('dynamodb', config=DYNAMODB_CONFIG).Table(USER_TABLE_NAME),
+)
+
+# username → actor ID of the existing user; missing users are not cached.
+# survives as long as the Lambda container is reused.
+ACTOR_IDS: TtlLruCache[str, str] = TtlLruCache(max_size=1024, ttl=60.0)
+
+
+def find_actor_id(username: str) -> Optional[str]:
+    """Finds the actor ID of a given user.
+
+    Only tests if the user exists in the user table, because the actor ID is
+    determined by the domain name and username.
+    Reuses the actor ID in ``ACTOR_IDS`` if any.
+
+    :returns: ``None`` if the user is not found.
+
+    :raises TooManyAccessError: if there are too many requests.
+    """
+    actor_id = ACTOR_IDS.get(username)
+    if actor_id is not None:
+        LOGGER.debug('reusing actor ID: %s', actor_id)
+        return actor_id
+    LOGGER.debug('looking up user: %s', username)
+    if not USER_TABLE.user_exists(username):
+        return None
+    actor_id = make_user_id(get_cached_domain_name(), username)
+    ACTOR_IDS.put(username, actor_id)
+    return actor_id
 
 
 def lambda_handler(event, _context):
@@ -56,8 +89,8 @@ def lambda_handler(event, _context):
             ]
         }
 
-    :raises KeyError: if no ``resource`` is specified, or if ``apiDomainName``
-    is not specified when ``DOMAIN_NAME`` is ``None``.
+    :raises KeyError: if no ``resource`` is specified, or if the domain name
+    parameter is not found in Parameter Store.
 
     :raises BadRequestError: if ``resource`` is invalid.
 
@@ -73,12 +106,11 @@ def lambda_handler(event, _context):
         username, domain_name = parse_acct_uri(event['resource'])
     except ValueError as exc:
         raise BadRequestError(f'{exc}') from exc
-    if domain_name != DOMAIN_NAME:
+    if domain_name != get_cached_domain_name():
         raise UnexpectedDomainError(f'unexpected domain name: {domain_name}')
 
-    LOGGER.debug('looking up user: %s', username)
-    user = USER_TABLE.find_user_by_username(username, DOMAIN_NAME)
-    if user is None:
+    actor_id = find_actor_id(username)
+    if actor_id is None:
         raise NotFoundError(f'no such user: {username}')
 
     return {
@@ -87,7 +119,7 @@ def lambda_handler(event, _context):
             {
                 'rel': 'self',
                 'type': 'application/activity+json',
-                'href': user.id,
+                'href': actor_id,
             },
         ],
     }
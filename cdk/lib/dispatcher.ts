@@ -106,8 +106,12 @@ export class Dispatcher extends Construct {
           OBJECTS_BUCKET_NAME: objectStore.objectsBucket.bucketName,
           DOMAIN_NAME_PARAMETER_PATH:
             systemParameters.domainNameParameter.parameterName,
+          // skips building debug logs; set "DEBUG" to investigate
+          LOG_LEVEL: 'INFO',
         },
-        memorySize: 256,
+        // resolves remote objects over HTTPS and parses JSON; both are
+        // CPU-bound and CPU share scales with memory.
+        memorySize: 512,
         timeout: Duration.seconds(30),
       },
     );
@@ -139,6 +143,8 @@ export class Dispatcher extends Construct {
           USER_TABLE_NAME: userTable.userTable.tableName,
           DOMAIN_NAME_PARAMETER_PATH:
             systemParameters.domainNameParameter.parameterName,
+          // skips building debug logs; set "DEBUG" to investigate
+          LOG_LEVEL: 'INFO',
         },
         memorySize: 256,
         timeout: Duration.seconds(30),
@@ -497,7 +503,9 @@ export class Dispatcher extends Construct {
       `ForEachRecipient_${workflowId}`,
       {
         comment: 'For each recipient',
-        maxConcurrency: 10,
+        // recipients are deduplicated by shared inbox, so concurrent
+        // deliveries mostly go to distinct hosts
+        maxConcurrency: 40,
         itemsPath: stepfunctions.JsonPath.stringAt('$.recipients'),
         parameters: {
           'activity.$': '$$.Execution.Input.activity',
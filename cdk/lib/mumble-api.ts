@@ -139,6 +139,8 @@ export class MumbleApi extends Construct {
           DOMAIN_NAME_PARAMETER_PATH:
             systemParameters.domainNameParameter.parameterName,
           QUARANTINE_BUCKET_NAME: objectStore.quarantineBucket.bucketName,
+          // skips building debug logs; set "DEBUG" to investigate
+          LOG_LEVEL: 'INFO',
         },
         memorySize: 256,
         timeout: Duration.seconds(20),
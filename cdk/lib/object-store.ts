@@ -324,15 +324,6 @@ export class ObjectStore extends Construct {
     return this.objectsBucket.grantRead(grantee, OBJECTS_FOLDER_PREFIX + '*');
   }
 
-  /** Grants a given principal batch update on the object table. */
-  grantBatchUpdateObjectTable(grantee: iam.IGrantable): iam.Grant {
-    return iam.Grant.addToPrincipal({
-      grantee,
-      actions: ['dynamodb:PartiQLUpdate'],
-      resourceArns: [this.objectTable.tableArn],
-    });
-  }
-
   // creates an `EventPattern` that triggers when an object is created in
   // a given folder in the objects bucket.
   private objectCreatedEventPattern(pathPrefix: string): events.EventPattern {
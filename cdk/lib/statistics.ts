@@ -57,7 +57,6 @@ export class Statistics extends Construct {
       },
     );
     userTable.userTable.grantReadWriteData(updateUserStatisticsLambda);
-    userTable.grantBatchUpdateUserTable(updateUserStatisticsLambda);
     updateUserStatisticsLambda.addEventSource(
       new eventsources.DynamoEventSource(
         userTable.userTable,
@@ -90,7 +89,6 @@ export class Statistics extends Construct {
       },
     );
     objectStore.objectTable.grantReadWriteData(updateObjectStatisticsLambda);
-    objectStore.grantBatchUpdateObjectTable(updateObjectStatisticsLambda);
     updateObjectStatisticsLambda.addEventSource(
       new eventsources.DynamoEventSource(
         objectStore.objectTable,
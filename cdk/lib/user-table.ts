@@ -126,13 +126,4 @@ export class UserTable extends Construct {
       resourceArns: [paramArn],
     });
   }
-
-  /** Grants PartiQL update on the user table to a given principal. */
-  grantBatchUpdateUserTable(grantee: iam.IGrantable): iam.Grant {
-    return iam.Grant.addToPrincipal({
-      grantee,
-      actions: ['dynamodb:PartiQLUpdate'],
-      resourceArns: [this.userTable.tableArn],
-    });
-  }
 }
@@ -4,16 +4,22 @@
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import cached_property
 import logging
-from typing import Any, Dict, Iterable, Optional, Union
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import requests
 from .activity_streams import (
     ACTIVITY_STREAMS_CONTEXT,
+    ACTIVITY_STREAMS_PUBLIC_ADDRESS,
     get as activity_streams_get,
 )
+from .cache import TtlLruCache
 from .data_objects import Note
 from .objects import (
     ACTOR_TYPES,
+    MISSING,
     APObject,
     DictObject,
     Link,
@@ -23,26 +29,110 @@ from .objects import (
 
 
 LOGGER = logging.getLogger('libactivitypub.activity')
-LOGGER.setLevel(logging.DEBUG)
 
-RESERVED_TARGETS = [
-    'https://www.w3.org/ns/activitystreams#Public',
-]
+RESERVED_TARGETS = frozenset([
+    ACTIVITY_STREAMS_PUBLIC_ADDRESS,
+    # compact forms of the public address allowed by the spec
+    'as:Public',
+    'Public',
+])
+"""Targets that are never resolved."""
+
+RESOLVABLE_URI_SCHEMES = ('https://', 'http://')
+"""Prefixes of target URIs that can be resolved."""
+
+OPTIONAL_NOTE_PROPERTIES = ('to', 'cc', 'bcc')
+"""Optional properties of a note copied to a "Create" activity."""
+
+MAX_RESOLVERS = 16
+"""Maximum number of threads that resolve objects referenced in activities."""
+
+RESOLVER_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_RESOLVERS)
+"""Threads that resolve objects referenced in activities.
+
+Shared in the process, so the number of threads does not grow with the
+number of activities or targets.
+Tasks submitted to this executor must not wait for other tasks on it.
+"""
+
+RESOLVED_OBJECTS: TtlLruCache[str, DictObject] = TtlLruCache(
+    max_size=1024,
+    ttl=300.0,
+)
+"""Objects resolved over HTTP so far.
+
+Shared in the process, so activities referencing the same actor or object
+make a single HTTP request.
+Entries expire in 5 minutes by default so that updates on remote objects are
+eventually picked up.
+Call ``RESOLVED_OBJECTS.configure`` to change the size and time to live.
+"""
+
+FAILED_RESOLUTIONS: TtlLruCache[str, int] = TtlLruCache(
+    max_size=4096,
+    ttl=600.0,
+)
+"""Maps an object that could not be resolved over HTTP recently to the
+HTTP status code of the failure.
+
+Stops a deleted or locked object referenced many times, e.g., in "cc", from
+making as many failing requests.
+"""
+
+NEGATIVELY_CACHED_STATUS_CODES = frozenset([401, 403, 404, 410])
+"""HTTP status codes of failures remembered in ``FAILED_RESOLUTIONS``."""
+
+
+class RecentlyFailedError(requests.HTTPError):
+    """Raised instead of making an HTTP request for an object whose resolution
+    failed recently.
+
+    Has no ``response`` because no request is made.
+    """
+    status_code: int
+    """HTTP status code of the recent failure."""
+
+    def __init__(self, url: str, status_code: int):
+        """Initializes with the URL of the object and the HTTP status code of
+        the recent failure.
+        """
+        super().__init__(f'{status_code} (recently failed) for url: {url}')
+        self.status_code = status_code
+
+
+def get_error_status_code(exc: requests.HTTPError) -> Optional[int]:
+    """Returns the HTTP status code of a given error.
+
+    :returns: ``None`` if ``exc`` has no response.
+    """
+    if isinstance(exc, RecentlyFailedError):
+        return exc.status_code
+    if exc.response is None:
+        return None
+    return exc.response.status_code
 
 
 class Activity(DictObject):
     """Wraps an activity.
     """
+    REQUIRED_PROPERTIES: Tuple[str, ...] = ('actor',)
+    """Properties that an activity of this class must have."""
+
     def __init__(self, underlying: Dict[str, Any]):
         """Wraps a given ``dict`` representing an activity.
 
         :raises ValueError: if ``underlying`` does not represent a valid
-        object, or if ``underlying`` has no ``actor``.
+        object, or if ``underlying`` lacks any of ``REQUIRED_PROPERTIES``.
         """
         super().__init__(underlying)
-        if 'actor' not in underlying:
-            raise ValueError('invalid activity object: actor is missing')
-        self._underlying = underlying
+        for prop in self.REQUIRED_PROPERTIES:
+            if prop not in underlying:
+                raise ValueError(
+                    f'invalid {underlying["type"]} activity: {prop} is missing',
+                )
+        # type strings parsed from JSON are not interned; interning them makes
+        # later comparisons with literals hit the identity shortcut
+        self._type = sys.intern(self._type)
 
     @staticmethod
     def parse_object(obj: Dict[str, Any]) -> 'Activity':
@@ -51,32 +141,26 @@ class Activity(DictObject):
         :raises ValueError: if ``obj`` does not represent an activity object.
         """
         obj_type = obj.get('type')
-        # TODO: tabularize the following
-        if obj_type == 'Announce':
-            return Announce.parse_object(obj)
-        if obj_type == 'Create':
-            return Create.parse_object(obj)
-        if obj_type == 'Delete':
-            return Delete.parse_object(obj)
-        if obj_type == 'Follow':
-            return Follow.parse_object(obj)
-        if obj_type == 'Like':
-            return Like(obj)
-        if obj_type == 'Undo':
-            return Undo.parse_object(obj)
-        if obj_type == 'Accept':
-            return Accept(obj)
-        if obj_type == 'Reject':
-            return Reject(obj)
+        parse = ACTIVITY_PARSERS.get(obj_type)
+        if parse is not None:
+            return parse(obj)
         if obj_type is not None:
             raise ValueError(f'unsupported activity type: {obj_type}')
         raise ValueError('invalid object: type is missing')
 
-    @property
+    @cached_property
     def actor_id(self) -> str:
         """ID of the actor of this activity.
         """
-        return Reference(self._underlying['actor']).id
+        return Reference.get_id(self._underlying['actor'])
+
+    @cached_property
+    def _object_reference(self) -> Reference:
+        """Reference to ``object`` shared by properties and resolution.
+
+        :raises KeyError: if this activity has no ``object``.
+        """
+        return Reference(self._underlying['object'])
 
     def is_deliverable(self) -> bool:
         """Returns if this activity has minimum properties that make it
@@ -87,8 +171,12 @@ class Activity(DictObject):
         * "id"
         * "type"
         """
-        required_props = ['@context', 'id', 'type']
-        return all((p in self._underlying for p in required_props))
+        underlying = self._underlying
+        return (
+            '@context' in underlying
+            and 'id' in underlying
+            and 'type' in underlying
+        )
 
     @abstractmethod
     def visit(self, visitor: 'ActivityVisitor'):
@@ -112,7 +200,7 @@ class Activity(DictObject):
         actor_ref = Reference(self._underlying['actor'])
         actor: Optional[APObject] = object_store.get(actor_ref.id)
         if actor is None:
-            actor = DictObject.resolve(actor_ref.ref)
+            actor = resolve_cached(actor_ref)
         if actor.type not in ACTOR_TYPES:
             raise ValueError(f'invalid actor type: {actor.type}')
         object_store.add(actor)
@@ -125,22 +213,40 @@ class MessageActivity(Activity):
     """
     @abstractmethod
     def resolve_objects(self, object_store: ObjectStore):
-        """Resolves actors referenced in ``to`` and ``cc`` fields.
+        """Resolves the actor, actors referenced in ``to`` and ``cc`` fields,
+        and ``object`` if any.
+
+        Resolves them concurrently on ``RESOLVER_EXECUTOR``.
+        Must not be called on ``RESOLVER_EXECUTOR``.
 
         Subclasses still must implement this method but can call this method
-        to deal with ``to`` and ``cc`` fields.
+        to deal with those fields.
+
+        :raises ValueError: if the actor has an invalid type.
         """
-        super().resolve_objects(object_store)
-        if 'to' in self._underlying:
-            MessageActivity.resolve_targets(
-                self._underlying['to'],
-                object_store,
-            )
-        if 'cc' in self._underlying:
-            MessageActivity.resolve_targets(
-                self._underlying['cc'],
+        resolve_actor = super().resolve_objects
+        underlying = self._underlying
+        targets: List[str] = []
+        for field in ('to', 'cc'):
+            field_targets = underlying.get(field)
+            if isinstance(field_targets, str):
+                targets.append(field_targets)
+            elif field_targets is not None:
+                targets.extend(field_targets)
+        futures = [RESOLVER_EXECUTOR.submit(resolve_actor, object_store)]
+        if 'object' in underlying:
+            futures.append(RESOLVER_EXECUTOR.submit(
+                resolve_reference,
+                self._object_reference,
                 object_store,
-            )
+            ))
+        try:
+            # fans out targets on the same executor from this thread
+            MessageActivity.resolve_targets(targets, object_store)
+        finally:
+            wait(futures)
+        for future in futures:
+            future.result()
 
     @staticmethod
     def resolve_targets(
@@ -150,40 +256,68 @@ class MessageActivity(Activity):
         """Resolves target actors.
 
         Ignores targets other than an actor.
+        Resolves multiple targets concurrently on ``RESOLVER_EXECUTOR``, and
+        duplicate targets only once.
+        Must not be called on ``RESOLVER_EXECUTOR``.
 
         :raises requests.HTTPError: if an HTTP request fails.
         but an unauthorized (401) error is ignored with a warning message.
         """
         if isinstance(targets, str):
-            MessageActivity.resolve_target(targets, object_store)
-        else:
-            for target in targets:
-                try:
-                    MessageActivity.resolve_target(target, object_store)
-                except requests.HTTPError as exc:
-                    # ignores an unauthorized target
-                    if exc.response.status_code == 401:
-                        LOGGER.warning(
-                            'unauthorized access to target: %s',
-                            target,
-                        )
-                    else:
-                        raise exc
+            MessageActivity.resolve_target_if_authorized(targets, object_store)
+            return
+        # relays often duplicate targets
+        targets = list(dict.fromkeys(targets))
+        if len(targets) == 0:
+            return
+        # resolves targets concurrently to overlap HTTP round trips, and
+        # consumes the results to propagate an exception if any
+        list(RESOLVER_EXECUTOR.map(
+            lambda target: MessageActivity.resolve_target_if_authorized(
+                target,
+                object_store,
+            ),
+            targets,
+        ))
+
+    @staticmethod
+    def resolve_target_if_authorized(
+        target_ref: str,
+        object_store: ObjectStore,
+    ):
+        """Resolves a target actor but ignores an unauthorized (401) error
+        with a warning message.
+
+        :raises requests.HTTPError: if an HTTP request fails with an error
+        other than unauthorized (401).
+        """
+        try:
+            MessageActivity.resolve_target(target_ref, object_store)
+        except requests.HTTPError as exc:
+            # ignores an unauthorized target
+            if get_error_status_code(exc) == 401:
+                LOGGER.warning('unauthorized access to target: %s', target_ref)
+            else:
+                raise exc
 
     @staticmethod
     def resolve_target(target_ref: str, object_store: ObjectStore):
         """Resolves a target actor.
 
         Ignores a target other than an actor.
-        Ignores target in ``RESERVED_TARGETS``, too.
+        Ignores target in ``RESERVED_TARGETS``, and target that is not an HTTP
+        URI, too.
 
         :raises requests.HTTPError: if an HTTP request fails.
         """
         if target_ref in RESERVED_TARGETS:
             return
+        if not target_ref.startswith(RESOLVABLE_URI_SCHEMES):
+            LOGGER.debug('ignoring non-HTTP target: %s', target_ref)
+            return
         target = object_store.get(target_ref)
         if target is None:
-            target = DictObject.resolve(target_ref)
+            target = resolve_cached(Reference(target_ref))
             if target.type in ACTOR_TYPES:
                 object_store.add(target)
             else:
@@ -210,12 +344,9 @@ class Announce(MessageActivity):
     def resolve_objects(self, object_store: ObjectStore):
         """Resolves the referenced object.
 
-        Resolves ``object``.
+        Resolves ``object`` along with the actor and targets.
         """
         super().resolve_objects(object_store)
-        # resolves the object
-        if 'object' in self._underlying:
-            resolve_object(self._underlying['object'], object_store)
 
 
 class Create(MessageActivity):
@@ -257,23 +388,25 @@ class Create(MessageActivity):
             "published": note.published,
             "object": note.to_dict(with_context=False),
         }
-        options = ['to', 'cc', 'bcc']
-        for option in options:
-            if hasattr(note, option):
-                obj[option] = getattr(note, option)
+        for option in OPTIONAL_NOTE_PROPERTIES:
+            value = getattr(note, option, MISSING)
+            if value is not MISSING:
+                obj[option] = value
         return Create(obj)
 
     @property
     def object(self) -> Reference:
         """Reference to the created object.
         """
-        return Reference(self._underlying['object'])
+        return self._object_reference
 
     @object.setter
     def object(self, obj: Reference):
         """Replaces the created object.
         """
         self._underlying['object'] = obj.ref
+        # invalidates the cached reference
+        self.__dict__.pop('_object_reference', None)
 
     def visit(self, visitor: 'ActivityVisitor'):
         visitor.visit_create(self)
@@ -281,11 +414,9 @@ class Create(MessageActivity):
     def resolve_objects(self, object_store: ObjectStore):
         """Resolves the referenced object.
 
-        Resolves ``object``.
+        Resolves ``object`` along with the actor and targets.
         """
         super().resolve_objects(object_store)
-        if 'object' in self._underlying:
-            resolve_object(self._underlying['object'], object_store)
 
 
 class Delete(Activity):
@@ -316,11 +447,11 @@ class Delete(Activity):
             raise TypeError(f'type must be "Delete": {obj.get("type")}')
         return Delete(obj)
 
-    @property
+    @cached_property
     def object_id(self) -> str:
         """ID of the (to be) deleted object.
         """
-        return Reference(self._underlying['object']).id
+        return self._object_reference.id
 
     def visit(self, visitor: 'ActivityVisitor'):
         visitor.visit_delete(self)
@@ -331,21 +462,13 @@ class Delete(Activity):
         Resolves ``object``.
         """
         super().resolve_objects(object_store)
-        resolve_object(self._underlying['object'], object_store)
+        resolve_reference(self._object_reference, object_store)
 
 
 class Follow(Activity):
     """Wraps a "Follow" activity.
     """
-    def __init__(self, underlying: Dict[str, Any]):
-        """Wraps a given "Follow" activity object.
-
-        :raises ValueError: if ``underlying`` does not represent an activity,
-        or if ``underlying`` does not have ``object``.
-        """
-        super().__init__(underlying)
-        if 'object' not in underlying:
-            raise ValueError('invalid follow activity: object is missing')
+    REQUIRED_PROPERTIES = ('actor', 'object')
 
     @staticmethod
     def parse_object(obj: Dict[str, Any]) -> 'Follow':
@@ -367,27 +490,19 @@ class Follow(Activity):
         Resolves ``object``.
         """
         super().resolve_objects(object_store)
-        resolve_object(self._underlying['object'], object_store)
+        resolve_reference(self._object_reference, object_store)
 
-    @property
+    @cached_property
     def followed_id(self):
         """ID of the followed object.
         """
-        return Reference(self._underlying['object']).id
+        return self._object_reference.id
 
 
 class Like(Activity):
     """Wraps a "Like" activity.
     """
-    def __init__(self, underlying: Dict[str, Any]):
-        """Wraps a given "Like" activity object.
-
-        :raises ValueError: if ``underlying`` does not represent an activity,
-        or if ``underlying`` does not have ``object``.
-        """
-        super().__init__(underlying)
-        if 'object' not in underlying:
-            raise ValueError('invalid like activity: object is missing')
+    REQUIRED_PROPERTIES = ('actor', 'object')
 
     def visit(self, visitor: 'ActivityVisitor'):
         visitor.visit_like(self)
@@ -398,21 +513,13 @@ class Like(Activity):
         Resolves ``object``.
         """
         super().resolve_objects(object_store)
-        resolve_object(self._underlying['object'], object_store)
+        resolve_reference(self._object_reference, object_store)
 
 
 class Undo(Activity):
     """Wraps an "Undo" activity.
     """
-    def __init__(self, underlying: Dict[str, Any]):
-        """Wraps a given "Undo" activity object.
-
-        :raises ValueError: if ``underlying`` does not represent an activity,
-        or if ``underlying`` does not have ``object``.
-        """
-        super().__init__(underlying)
-        if 'object' not in underlying:
-            raise ValueError('invalid undo activity: object is missing')
+    REQUIRED_PROPERTIES = ('actor', 'object')
 
     @staticmethod
     def parse_object(obj: Dict[str, Any]) -> 'Undo':
@@ -434,7 +541,7 @@ class Undo(Activity):
         Resolves ``object``.
         """
         super().resolve_objects(object_store)
-        resolve_object(self._underlying['object'], object_store)
+        resolve_reference(self._object_reference, object_store)
 
     def resolve_undone_activity(self) -> Activity:
         """Resolves the undone activity.
@@ -449,11 +556,11 @@ class Undo(Activity):
         """
         return resolve_activity(self._underlying['object'])
 
-    @property
+    @cached_property
     def undone_id(self):
         """ID of the undone object.
         """
-        return Reference(self._underlying['object']).id
+        return self._object_reference.id
 
 
 class ResponseActivity(Activity):
@@ -461,15 +568,7 @@ class ResponseActivity(Activity):
 
     There are "Accept" and "Reject" so far.
     """
-    def __init__(self, underlying: Dict[str, Any]):
-        """Wraps a given response activity object.
-
-        :raises ValueError: if ``underlying`` does not represent an activity,
-        or if ``underlying`` does not have ``object``.
-        """
-        super().__init__(underlying)
-        if 'object' not in underlying:
-            raise ValueError('invalid response activity: object is missing')
+    REQUIRED_PROPERTIES = ('actor', 'object')
 
     def resolve_objects(self, object_store: ObjectStore):
         """Resolves the reference object.
@@ -477,13 +576,13 @@ class ResponseActivity(Activity):
         Resolves ``object``.
         """
         super().resolve_objects(object_store)
-        resolve_object(self._underlying['object'], object_store)
+        resolve_reference(self._object_reference, object_store)
 
-    @property
+    @cached_property
     def object_id(self) -> str:
         """ID of the object.
         """
-        return Reference(self._underlying['object']).id
+        return self._object_reference.id
 
     def resolve_object_activity(self) -> Activity:
         """Resolves the object of this activity.
@@ -546,51 +645,120 @@ class Reject(ResponseActivity):
         visitor.visit_reject(self)
 
 
+ACTIVITY_PARSERS: Dict[str, Callable[[Dict[str, Any]], Activity]] = {
+    'Announce': Announce,
+    'Create': Create,
+    'Delete': Delete,
+    'Follow': Follow,
+    'Like': Like,
+    'Undo': Undo,
+    'Accept': Accept,
+    'Reject': Reject,
+}
+"""Maps an activity type to the class that wraps an activity object of the
+type.
+
+Classes are called directly because ``Activity.parse_object`` has already
+checked the type."""
+
+
+def log_ignored_activity(activity_type: str, activity: Activity):
+    """Logs an activity ignored by ``ActivityVisitor``.
+
+    Skips formatting the activity unless debug logging is enabled.
+    """
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            'ignoring "%s": %s',
+            activity_type,
+            activity._underlying, # pylint: disable=protected-access
+        )
+
+
 class ActivityVisitor(ABC):
     """Visitor that processes typed activities.
 
     You have to override visitor methods specific to your needs.
     Visitor methods do nothing by default.
     """
+    __slots__ = ()
+
     def visit_announce(self, announce: Announce):
         """Processes an "Announce" activity.
         """
-        LOGGER.debug('ignoring "Announce": %s', announce._underlying) # pylint: disable=protected-access
+        log_ignored_activity('Announce', announce)
 
     def visit_create(self, create: Create):
         """Processes a "Create" activity.
         """
-        LOGGER.debug('ignoring "Create": %s', create._underlying) # pylint: disable=protected-access
+        log_ignored_activity('Create', create)
 
     def visit_delete(self, delete: Delete):
         """Processes a "Delete" activity.
         """
-        LOGGER.debug('ignoring "Delete": %s', delete._underlying) # pylint: disable=protected-access
+        log_ignored_activity('Delete', delete)
 
     def visit_follow(self, follow: Follow):
         """Processes a "Follow" activity.
         """
-        LOGGER.debug('ignoring "Follow": %s', follow._underlying) # pylint: disable=protected-access
+        log_ignored_activity('Follow', follow)
 
     def visit_like(self, like: Like):
         """Processes a "Like" activity.
         """
-        LOGGER.debug('ignoring "Like": %s', like._underlying) # pylint: disable=protected-access
+        log_ignored_activity('Like', like)
 
     def visit_undo(self, undo: Undo):
         """Processes an "Undo" activity.
         """
-        LOGGER.debug('ignoring "Undo": %s', undo._underlying) # pylint: disable=protected-access
+        log_ignored_activity('Undo', undo)
 
     def visit_accept(self, accept: Accept):
         """Processes an "Accept" activity.
         """
-        LOGGER.debug('ignoring "Accept": %s', accept._underlying) # pylint: disable=protected-access
+        log_ignored_activity('Accept', accept)
 
     def visit_reject(self, reject: Reject):
         """Processes a "Reject" activity.
         """
-        LOGGER.debug('ignoring "Reject": %s', reject._underlying) # pylint: disable=protected-access
+        log_ignored_activity('Reject', reject)
+
+
+def resolve_cached(obj_ref: Reference) -> DictObject:
+    """Resolves a referenced object through ``RESOLVED_OBJECTS``.
+
+    Concurrent resolutions of the same object share a single HTTP request.
+    An embedded object is simply wrapped and never cached.
+    A resolution failed with a status in ``NEGATIVELY_CACHED_STATUS_CODES``
+    fails again with a new ``RecentlyFailedError`` of the same status without
+    a request for a while.
+
+    :raises RecentlyFailedError: if the resolution failed recently.
+
+    :raises requests.HTTPError: if an HTTP request fails.
+
+    :raises requests.Timeout: if an HTTP request times out.
+
+    :raises ValueError: if the object data is invalid.
+    """
+    if obj_ref.is_embedded():
+        return DictObject.resolve(obj_ref.ref)
+    failed_status = FAILED_RESOLUTIONS.get(obj_ref.id)
+    if failed_status is not None:
+        LOGGER.debug('reusing failed resolution: %s', obj_ref.id)
+        # raises a new error every time, because an exception object must
+        # not be shared among threads
+        raise RecentlyFailedError(obj_ref.id, failed_status)
+    try:
+        return RESOLVED_OBJECTS.get_or_load(
+            obj_ref.id,
+            lambda: DictObject.resolve(obj_ref.ref),
+        )
+    except requests.HTTPError as exc:
+        status_code = get_error_status_code(exc)
+        if status_code in NEGATIVELY_CACHED_STATUS_CODES:
+            FAILED_RESOLUTIONS.put(obj_ref.id, status_code)
+        raise
 
 
 def resolve_object(
@@ -616,19 +784,42 @@ def resolve_object(
 
     :raises TypeError: if the object data contains an incompatible type.
     """
-    obj_ref = Reference(maybe_obj)
+    return resolve_reference(Reference(maybe_obj), object_store)
+
+
+def resolve_reference(
+    obj_ref: Reference,
+    object_store: ObjectStore,
+) -> Optional[APObject]:
+    """Resolves a referenced object and stores in an ``ObjectStore``.
+
+    Works like ``resolve_object`` but takes an already wrapped reference.
+
+    :raises requests.HTTPError: if an HTTP request fails.
+    but an unauthorized (401) error is ignored with a warning message.
+
+    :raises requests.Timeout: if an HTTP request times out.
+
+    :raises ValueError: if the object data is invalid.
+
+    :raises TypeError: if the object data contains an incompatible type.
+    """
     obj = object_store.get(obj_ref.id)
-    if obj is None:
+    if obj is not None:
+        return obj
+    if obj_ref.is_embedded():
+        # an embedded object (typical of "Create") needs no HTTP request
+        obj = DictObject(obj_ref.ref)
+    else:
         try:
-            obj = DictObject.resolve(obj_ref.ref)
+            obj = resolve_cached(obj_ref)
         except requests.HTTPError as exc:
             # ignores an unauthorized object with a warning
-            if exc.response.status_code == 401:
+            if get_error_status_code(exc) == 401:
                 LOGGER.warning('unauthorized object: %s', obj_ref.ref)
-            else:
-                raise exc
-        else:
-            object_store.add(obj)
+                return None
+            raise exc
+    object_store.add(obj)
     return obj
 
 
@@ -5,17 +5,23 @@ ActivityStreams.
 """
 
 from email.utils import formatdate
+from functools import lru_cache
 import logging
-from typing import Any, Dict, TypedDict
+import re
+import time
+from typing import Any, Dict, Optional, Tuple, TypedDict
 from urllib.parse import urlparse
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from . import VERSION
-from .mime_types import ACTIVITY_STREAMS_MIME_TYPES
+from .cache import TtlLruCache
+from .mime_types import ACTIVITY_STREAMS_ACCEPT
 from .signature import digest_request_body, make_signature_header
 
 
 LOGGER = logging.getLogger('libactivitypub.activity_streams')
-LOGGER.setLevel(logging.DEBUG)
 
 ACTIVITY_STREAMS_CONTEXT = 'https://www.w3.org/ns/activitystreams'
 """JSON-LD context for ActivityStream."""
@@ -28,6 +34,103 @@ MUMBLE_USER_AGENT = f'Mumble/{VERSION}'
 DEFAULT_REQUEST_TIMEOUT = 30.0
 """Default timeout of requests."""
 
+MAX_RETRY_BACKOFF = 1.0
+"""Maximum seconds to sleep before retrying a request."""
+
+
+class BoundedRetry(Retry):
+    """``Retry`` that never sleeps longer than ``MAX_RETRY_BACKOFF`` seconds
+    before a retry.
+
+    urllib3 has no portable option to cap the backoff; ``backoff_max`` is
+    only available in urllib3 2.
+    """
+    def get_backoff_time(self) -> float:
+        return min(super().get_backoff_time(), MAX_RETRY_BACKOFF)
+
+
+def make_http_session() -> requests.Session:
+    """Creates a ``requests.Session`` that pools connections per host.
+
+    Idempotent requests are retried on connection errors and on 429, 502, 503,
+    and 504 responses.
+    Non-idempotent requests like POST are only retried when connecting fails.
+    Up to 16 connections per host are kept for reuse.
+    The last response is returned as is after retries are exhausted, so that
+    ``raise_for_status`` still raises ``requests.HTTPError``.
+
+    Nothing waits without a bound: every request is made with
+    ``DEFAULT_REQUEST_TIMEOUT``, a request never waits for a pooled
+    connection, and "Retry-After" is ignored so that a throttling server
+    cannot hold a Lambda function until it times out.
+    A backoff before a retry, e.g., on 429, is capped at
+    ``MAX_RETRY_BACKOFF``.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        # as many as the threads resolving objects; see activity.MAX_RESOLVERS
+        pool_maxsize=16,
+        # requests does not pass a pool timeout, so a blocking pool could
+        # wait for a free connection forever; opens an extra connection
+        # instead
+        pool_block=False,
+        max_retries=BoundedRetry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+HTTP_SESSION = make_http_session()
+"""Session shared among requests.
+
+Reuses connections to the same host across requests, and across invocations
+of a warm Lambda container.
+"""
+
+
+CONTENT_TYPE_SIGNATURE_HEADER = ('content-type', 'application/json')
+"""Content type header signed by ``post``."""
+
+
+class CachedDocument(TypedDict):
+    """Document obtained by ``get`` and its validators.
+    """
+    content: bytes
+    """Raw JSON body.
+
+    Kept unparsed so that every ``get`` returns a ``dict`` of its own; callers
+    may modify the returned ``dict``.
+    """
+    etag: Optional[str]
+    """"ETag" header of the response."""
+    last_modified: Optional[str]
+    """"Last-Modified" header of the response."""
+    fresh_until: float
+    """Time (``time.monotonic``) until which the document can be used without
+    revalidation."""
+
+
+CACHED_DOCUMENTS: TtlLruCache[str, CachedDocument] = TtlLruCache(
+    max_size=1024,
+    ttl=86400.0,
+)
+"""Documents obtained by ``get`` so far.
+
+A document is used as it is while it is fresh according to "Cache-Control:
+max-age", and revalidated with a conditional request after that.
+"""
+
+MAX_AGE_PATTERN = re.compile(r'max-age=(\d+)')
+"""Pattern that extracts "max-age" from "Cache-Control"."""
+
 
 class PrivateKey(TypedDict):
     """Private key.
@@ -41,20 +144,92 @@ class PrivateKey(TypedDict):
 def get(endpoint: str) -> Dict[str, Any]:
     """Makes a GET request to a given endpoint.
 
+    Returns a cached document while it is fresh.
+    Revalidates a stale cached document with "If-None-Match" and
+    "If-Modified-Since", and returns it if the endpoint responds with 304.
+    A cached document is parsed on every call, so the returned ``dict`` is
+    never shared with other callers.
+
     :raises requests.HTTPError: if the HTTP request fails.
 
     :raises requests.Timeout: if the request times out.
     """
-    res = requests.get(
+    now = time.monotonic()
+    cached = CACHED_DOCUMENTS.get(endpoint)
+    headers = {
+        'User-Agent': MUMBLE_USER_AGENT,
+        'Accept': ACTIVITY_STREAMS_ACCEPT,
+    }
+    if cached is not None:
+        if now < cached['fresh_until']:
+            return orjson.loads(cached['content'])
+        if cached['etag'] is not None:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified'] is not None:
+            headers['If-Modified-Since'] = cached['last_modified']
+    res = HTTP_SESSION.get(
         endpoint,
-        headers={
-            'User-Agent': MUMBLE_USER_AGENT,
-            'Accept': ', '.join(ACTIVITY_STREAMS_MIME_TYPES),
-        },
+        headers=headers,
         timeout=DEFAULT_REQUEST_TIMEOUT,
     )
+    if cached is not None and res.status_code == 304:
+        LOGGER.debug('not modified: %s', endpoint)
+        cache_document(endpoint, res, cached['content'], now, cached)
+        return orjson.loads(cached['content'])
     res.raise_for_status()
-    return res.json()
+    # orjson directly parses bytes without decoding them into str.
+    body = orjson.loads(res.content)
+    cache_document(endpoint, res, res.content, now)
+    return body
+
+
+def cache_document(
+    endpoint: str,
+    res: requests.Response,
+    content: bytes,
+    now: float,
+    revalidated: Optional[CachedDocument] = None,
+):
+    """Caches a document obtained from a given endpoint in
+    ``CACHED_DOCUMENTS``.
+
+    ``revalidated`` is the cached document that ``res`` (304) has just
+    revalidated. Its validators are kept unless ``res`` has new ones.
+
+    Does not cache the document if "Cache-Control" has "no-store", or if the
+    response has neither validators nor "max-age".
+    """
+    cache_control = res.headers.get('Cache-Control', '')
+    if 'no-store' in cache_control:
+        return
+    max_age = 0
+    if 'no-cache' not in cache_control:
+        match = MAX_AGE_PATTERN.search(cache_control)
+        if match is not None:
+            max_age = int(match.group(1))
+    etag = res.headers.get('ETag')
+    last_modified = res.headers.get('Last-Modified')
+    if revalidated is not None:
+        etag = etag or revalidated['etag']
+        last_modified = last_modified or revalidated['last_modified']
+    if max_age == 0 and etag is None and last_modified is None:
+        return
+    CACHED_DOCUMENTS.put(endpoint, {
+        'content': content,
+        'etag': etag,
+        'last_modified': last_modified,
+        'fresh_until': now + max_age,
+    })
+
+
+@lru_cache(maxsize=1024)
+def parse_endpoint(endpoint: str) -> Tuple[str, Optional[str]]:
+    """Extracts the path and host from a given endpoint URI.
+
+    Memoized because deliveries repeatedly hit the same inboxes.
+    """
+    parsed_uri = urlparse(endpoint)
+    return parsed_uri.path, parsed_uri.hostname
 
 
 def post(
@@ -80,9 +255,7 @@ def post(
 
     :raises requests.Timeout: if the request times out.
     """
-    parsed_uri = urlparse(endpoint)
-    path = parsed_uri.path
-    host = parsed_uri.hostname
+    path, host = parse_endpoint(endpoint)
     if not host:
         raise ValueError(f'no host in endpoint: {endpoint}')
     date = formatdate(usegmt=True)
@@ -95,16 +268,16 @@ def post(
             ('host', host),
             ('date', date),
             ('digest', body_digest),
-            ('content-type', 'application/json'),
+            CONTENT_TYPE_SIGNATURE_HEADER,
         ],
     )
     LOGGER.debug('signature header: %s', signature_header)
-    res = requests.post(
+    res = HTTP_SESSION.post(
         endpoint,
         data=body,
         headers={
             'User-Agent': MUMBLE_USER_AGENT,
-            'Accept': ', '.join(ACTIVITY_STREAMS_MIME_TYPES),
+            'Accept': ACTIVITY_STREAMS_ACCEPT,
             'Content-Type': 'application/json',
             'Date': date,
             'Digest': body_digest,
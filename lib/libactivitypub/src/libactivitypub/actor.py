@@ -3,24 +3,36 @@
 """Access to actors on ActivityPub networks.
 """
 
-from functools import cached_property
 import logging
 from typing import Any, Dict, Optional, TypedDict
-import requests
+import orjson
 from .activity_streams import (
+    CACHED_DOCUMENTS,
     DEFAULT_REQUEST_TIMEOUT,
+    HTTP_SESSION,
     MUMBLE_USER_AGENT,
     get as activity_streams_get,
 )
+from .cache import TtlLruCache
 from .inbox import Inbox
-from .mime_types import ACTIVITY_STREAMS_MIME_TYPES
+from .mime_types import ACTIVITY_STREAMS_MIME_TYPE_SET
 from .objects import DictObject
 from .outbox import Outbox
 from .utils import parse_webfinger_id
 
 
 LOGGER = logging.getLogger('libactivitypub.actor')
-LOGGER.setLevel(logging.DEBUG)
+
+RESOLVED_ACTORS: TtlLruCache[str, 'Actor'] = TtlLruCache(
+    max_size=2048,
+    ttl=3600.0,
+)
+"""Actors resolved by ``Actor.resolve_uri`` so far.
+
+Actors rarely change, so entries live longer than other objects; 1 hour by
+default.
+Call ``RESOLVED_ACTORS.configure`` to change the size and time to live.
+"""
 
 
 class PublicKey(TypedDict):
@@ -54,14 +66,21 @@ def dict_as_public_key(d: Dict[str, Any]) -> PublicKey: # pylint: disable=invali
 class WebFinger:
     """Wraps WebFinger query results.
     """
+    __slots__ = ('account', '_underlying', '_actor_uri')
+
     account: str
     """WebFinger ID of the account."""
+    _underlying: Dict[str, Any]
+    """WebFinger query results."""
+    _actor_uri: Optional[str]
+    """Actor URI memoized by ``actor_uri``."""
 
     def __init__(self, account: str, underlying: Dict[str, Any]):
         """Initializes with given WebFinger query results.
         """
         self.account = account
         self._underlying = underlying
+        self._actor_uri = None
 
     @staticmethod
     def finger(account: str) -> 'WebFinger':
@@ -74,7 +93,7 @@ class WebFinger:
         _, domain = parse_webfinger_id(account)
         endpoint = f'https://{domain}/.well-known/webfinger?resource=acct:{account}'
         LOGGER.debug('GETting: %s', endpoint)
-        res = requests.get(
+        res = HTTP_SESSION.get(
             endpoint,
             headers={
                 'User-Agent': MUMBLE_USER_AGENT,
@@ -83,53 +102,83 @@ class WebFinger:
             timeout=DEFAULT_REQUEST_TIMEOUT,
         )
         res.raise_for_status()
-        underlying = res.json()
+        underlying = orjson.loads(res.content)
         return WebFinger(account, underlying)
 
-    @cached_property
-    def actor_uri(self):
+    @property
+    def actor_uri(self) -> str:
         """Actor URI (ID).
 
         :raises AttributeError: if no actor URI is provide.
         """
-        try:
-            links = self._underlying['links']
-            links = [
-                l for l in links if l.get('type') in ACTIVITY_STREAMS_MIME_TYPES
-            ]
-            if len(links) > 1:
+        if self._actor_uri is None:
+            self._actor_uri = self.find_actor_uri()
+        return self._actor_uri
+
+    def find_actor_uri(self) -> str:
+        """Finds the actor URI (ID) in the links.
+
+        :raises AttributeError: if no actor URI is provide.
+        """
+        # scans the links only once
+        first_link: Optional[Dict[str, Any]] = None
+        first_self_link: Optional[Dict[str, Any]] = None
+        num_links = 0
+        num_self_links = 0
+        for link in self._underlying.get('links', []):
+            if link.get('type') not in ACTIVITY_STREAMS_MIME_TYPE_SET:
+                continue
+            num_links += 1
+            if first_link is None:
+                first_link = link
+            if link.get('rel') == 'self':
+                num_self_links += 1
+                if first_self_link is None:
+                    first_self_link = link
+        if num_links > 1:
+            LOGGER.warning('there are more than one actor URIs: %d', num_links)
+            if num_self_links > 1:
+                # warns but chooses the first link
                 LOGGER.warning(
-                    'there are more than one actor URIs: %d',
-                    len(links),
+                    'there are more than one "self" actor URIs: %d',
+                    num_self_links,
                 )
-                links = [l for l in links if l.get('rel') == 'self']
-                if len(links) > 1:
-                    # warns but chooses the first link
-                    LOGGER.warning(
-                        'there are more than one "self" actor URIs: %d',
-                        len(links),
-                    )
-            return links[0]['href']
-        except (IndexError, KeyError) as exc:
-            raise AttributeError('no Actor URI is provided') from exc
+            link = first_self_link
+        else:
+            link = first_link
+        if link is None or 'href' not in link:
+            raise AttributeError('no Actor URI is provided')
+        return link['href']
 
 
 class Actor(DictObject):
     """Actor on ActivityPub networks.
     """
+    __slots__ = ()
+
     @staticmethod
-    def resolve_uri(actor_uri: str) -> 'Actor':
+    def resolve_uri(actor_uri: str, refresh: bool=False) -> 'Actor':
         """Resolves the actor at a given URI (ID).
 
+        The actor is cached in ``RESOLVED_ACTORS``.
+
+        :param bool refresh: discards the cached actor and document, and
+        requests the actor again. Useful when the cached actor may be out of
+        date; e.g., the actor may have rotated its key.
+
         :raises requests.HTTPError: if an HTTP request fails.
 
         :raises requests.Timeout: if an HTTP request times out.
 
         :raises TypeError: if the resolved object is not a valid actor.
         """
-        LOGGER.debug('requesting actor: %s', actor_uri)
-        underlying = activity_streams_get(actor_uri)
-        return Actor(underlying)
+        def load() -> Actor:
+            LOGGER.debug('requesting actor: %s', actor_uri)
+            return Actor(activity_streams_get(actor_uri))
+        if refresh:
+            RESOLVED_ACTORS.remove(actor_uri)
+            CACHED_DOCUMENTS.remove(actor_uri)
+        return RESOLVED_ACTORS.get_or_load(actor_uri, load)
 
     @staticmethod
     def resolve_webfinger_id(account: str) -> 'Actor':
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""Provides an in-process cache.
+
+Lambda functions reuse the process while the container is warm, so a cache
+at module scope survives across invocations.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future
+import copy
+from threading import Lock
+import time
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class TtlLruCache(Generic[K, V]):
+    """Cache whose entries expire after a fixed time to live.
+
+    Evicts the least recently used entry when the cache is full.
+
+    Thread-safe.
+    Concurrent ``get_or_load`` calls for the same key share a single load.
+    """
+    max_size: int
+    """Maximum number of entries."""
+    ttl: float
+    """Time to live of an entry in seconds."""
+    _entries: 'OrderedDict[K, Tuple[V, float]]'
+    """Maps a key to the value and the time when the entry expires.
+    From the least recently used to the most recently used."""
+    _loading: Dict[K, 'Future[V]']
+    """Maps a key to the result of the load in progress."""
+    _lock: Lock
+    """Lock that guards ``_entries`` and ``_loading``."""
+
+    def __init__(self, max_size: int, ttl: float):
+        """Initializes an empty cache.
+
+        :raises ValueError: if ``max_size`` is not positive,
+        or if ``ttl`` is negative.
+        """
+        if max_size <= 0:
+            raise ValueError(f'max_size must be positive: {max_size}')
+        if ttl < 0:
+            raise ValueError(f'ttl must not be negative: {ttl}')
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._lock = Lock()
+
+    def configure(self, max_size: int, ttl: float):
+        """Changes the maximum number of entries and the time to live.
+
+        Evicts the least recently used entries that no longer fit.
+        The new time to live applies to entries put afterward.
+
+        :raises ValueError: if ``max_size`` is not positive,
+        or if ``ttl`` is negative.
+        """
+        if max_size <= 0:
+            raise ValueError(f'max_size must be positive: {max_size}')
+        if ttl < 0:
+            raise ValueError(f'ttl must not be negative: {ttl}')
+        with self._lock:
+            self.max_size = max_size
+            self.ttl = ttl
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Returns the number of entries including expired ones.
+        """
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        """Obtains the value associated with a given key.
+
+        :returns: ``None`` if there is no value associated with ``key``,
+        or if the value has expired.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return self._get(key, now)
+
+    def put(self, key: K, value: V):
+        """Associates a given value with a given key.
+
+        Replaces the existing value if there is one.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._put(key, value, now)
+
+    def remove(self, key: K):
+        """Removes the value associated with a given key if any.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_or_load(self, key: K, load: Callable[[], V]) -> V:
+        """Obtains the value associated with a given key, or loads and caches
+        it if there is no value.
+
+        If another thread is already loading the value for ``key``, waits for
+        that load and shares its result instead of calling ``load``.
+        If ``load`` raises an exception, nothing is cached, and every caller
+        waiting for the same key raises a shallow copy of the exception
+        chained from the original, because an exception object must not be
+        raised in multiple threads.
+
+        :param Callable[[], V] load: function that loads the value.
+        """
+        now = time.monotonic()
+        with self._lock:
+            value = self._get(key, now)
+            if value is not None:
+                return value
+            loading = self._loading.get(key)
+            if loading is None:
+                loading = Future()
+                self._loading[key] = loading
+                is_loader = True
+            else:
+                is_loader = False
+        if not is_loader:
+            exc = loading.exception()
+            if exc is not None:
+                raise copy.copy(exc) from exc
+            return loading.result()
+        try:
+            value = load()
+        except BaseException as exc:
+            with self._lock:
+                del self._loading[key]
+            loading.set_exception(exc)
+            raise
+        with self._lock:
+            self._put(key, value, time.monotonic())
+            del self._loading[key]
+        loading.set_result(value)
+        return value
+
+    def _get(self, key: K, now: float) -> Optional[V]:
+        # must be called while locked
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if now >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key: K, value: V, now: float):
+        # must be called while locked
+        self._entries[key] = (value, now + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all the entries.
+        """
+        with self._lock:
+            self._entries.clear()
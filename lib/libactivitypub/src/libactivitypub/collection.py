@@ -9,7 +9,6 @@ from .activity_streams import get as activity_streams_get
 
 
 LOGGER = logging.getLogger('libactivitypub.collection')
-LOGGER.setLevel(logging.DEBUG)
 
 
 def resolve_collection_page(
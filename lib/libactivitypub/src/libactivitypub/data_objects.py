@@ -5,12 +5,11 @@
 
 import logging
 from typing import Any, Dict
-from .objects import DictObject, Reference
+from .objects import MISSING, DictObject, Reference
 from .utils import is_sequence_of
 
 
 LOGGER = logging.getLogger('libactivitypub.data_objects')
-LOGGER.setLevel(logging.DEBUG)
 
 COLLECTION_TYPES = ['Collection', 'OrderedCollection']
 """Types representing a collection."""
@@ -19,6 +18,8 @@ COLLECTION_TYPES = ['Collection', 'OrderedCollection']
 class Note(DictObject):
     """Wraps a "Note" object.
     """
+    __slots__ = ()
+
     def __init__(self, underlying: Dict[str, Any]):
         """Wraps a given ``dict`` representing a "Note".
 
@@ -34,25 +35,25 @@ class Note(DictObject):
         or if ``underlying`` has a non-sequence "attachment".
         """
         super().__init__(underlying)
-        if 'content' not in underlying:
+        # looks up each property only once
+        get = underlying.get
+        content = get('content', MISSING)
+        if content is MISSING:
             raise TypeError('invalid note: missing content')
-        if not isinstance(underlying['content'], str):
-            raise TypeError(
-                f'content must be str but {type(underlying["content"])}',
-            )
-        if (
-            'attributedTo' in underlying
-            and not isinstance(underlying['attributedTo'], str)
-        ):
+        if not isinstance(content, str):
+            raise TypeError(f'content must be str but {type(content)}')
+        attributed_to = get('attributedTo', MISSING)
+        if attributed_to is not MISSING and not isinstance(attributed_to, str):
             raise TypeError(
-                'attributedTo must be str but'
-                f' {type(underlying["attributedTo"])}',
+                f'attributedTo must be str but {type(attributed_to)}',
             )
-        if 'replies' in underlying:
-            Reference(underlying['replies']) # type check
+        replies = get('replies', MISSING)
+        if replies is not MISSING:
+            Reference.validate(replies)
+        attachment = get('attachment', MISSING)
         if (
-            'attachment' in underlying
-            and not is_sequence_of(underlying['attachment'], lambda _: True)
+            attachment is not MISSING
+            and not is_sequence_of(attachment, lambda _: True)
         ):
             raise TypeError('attachment must be a sequence')
 
@@ -7,12 +7,13 @@ import logging
 
 
 LOGGER = logging.getLogger('libactivity.inbox')
-LOGGER.setLevel(logging.DEBUG)
 
 
 class Inbox:
     """Wraps an inbox.
     """
+    __slots__ = ('inbox_uri',)
+
     def __init__(self, inbox_uri: str):
         """Initialized with a given inbox URI.
         """
@@ -3,7 +3,7 @@
 """Defines common MIME types.
 """
 
-from typing import List
+from typing import FrozenSet, List
 
 
 ACTIVITY_STREAMS_MIME_TYPES: List[str] = [
@@ -12,6 +12,14 @@ ACTIVITY_STREAMS_MIME_TYPES: List[str] = [
 ]
 """MIME types for ActivityStreams."""
 
+ACTIVITY_STREAMS_MIME_TYPE_SET: FrozenSet[str] = frozenset(
+    ACTIVITY_STREAMS_MIME_TYPES,
+)
+"""``ACTIVITY_STREAMS_MIME_TYPES`` as a set for membership tests."""
+
+ACTIVITY_STREAMS_ACCEPT: str = ', '.join(ACTIVITY_STREAMS_MIME_TYPES)
+"""Value of the "Accept" header for ActivityStreams endpoints."""
+
 DEFAULT_ACTIVITY_STREAMS_MIME_TYPE: str = (
     'application/ld+json; profile="https://www.w3.org/ns/activitystreams"'
 )
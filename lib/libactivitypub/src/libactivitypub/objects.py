@@ -5,6 +5,7 @@
 
 from abc import ABC, abstractmethod
 import logging
+from threading import Lock
 from typing import Any, Dict, Iterable, List, Optional, TypeVar, Type, Union
 from uuid6 import uuid7
 from .activity_streams import (
@@ -15,22 +16,26 @@ from .utils import is_str_or_strs
 
 
 LOGGER = logging.getLogger('libactivitypub.objects')
-LOGGER.setLevel(logging.DEBUG)
 
 
-ACTOR_TYPES = [
+ACTOR_TYPES = frozenset([
     'Application',
     'Group',
     'Organization',
     'Person',
     'Service',
-]
+])
 """Possible types for an actor."""
 
+MISSING = object()
+"""Sentinel that indicates a missing property."""
+
 
 class APObject(ABC):
     """Object in ActivityPub networks.
     """
+    __slots__ = ()
+
     @property
     def id(self) -> str: # pylint: disable=invalid-name
         """ID of this object.
@@ -111,13 +116,9 @@ class APObject(ABC):
 
         Returns ``False`` if this object has neither of ``to`` and ``cc``.
         """
-        def contains_public(addresses: Union[str, List[str]]) -> bool:
-            if isinstance(addresses, str):
-                return addresses == ACTIVITY_STREAMS_PUBLIC_ADDRESS
-            return ACTIVITY_STREAMS_PUBLIC_ADDRESS in addresses
-        if hasattr(self, 'to') and contains_public(self.to):
+        if hasattr(self, 'to') and contains_public_address(self.to):
             return True
-        if hasattr(self, 'cc') and contains_public(self.cc):
+        if hasattr(self, 'cc') and contains_public_address(self.cc):
             return True
         return False
 
@@ -127,9 +128,17 @@ T = TypeVar('T', bound='DictObject')
 
 class DictObject(APObject):
     """Object that wraps a ``dict``.
+
+    Declares ``__slots__`` because resolved objects are cached in bulk.
+    Subclasses that need ``cached_property`` omit ``__slots__`` to have
+    ``__dict__`` back.
     """
+    __slots__ = ('_underlying', '_type')
+
     _underlying: Dict[str, Any]
     """``dict`` representation of the object."""
+    _type: str
+    """Type of the object cached at construction."""
 
     def __init__(self, underlying: Dict[str, Any]):
         """Wraps a given ``dict``.
@@ -143,34 +152,30 @@ class DictObject(APObject):
         or if ``underlying`` has an invalid "bcc",
         or if ``underlying`` has an invalid "inReplyTo".
         """
-        if 'id' in underlying and not isinstance(underlying['id'], str):
-            raise TypeError(
-                f'id must be str but {type(underlying["id"])}',
-            )
-        if 'type' not in underlying:
+        # looks up each property only once
+        get = underlying.get
+        id_ = get('id', MISSING)
+        if id_ is not MISSING and not isinstance(id_, str):
+            raise TypeError(f'id must be str but {type(id_)}')
+        type_ = get('type', MISSING)
+        if type_ is MISSING:
             raise TypeError('invalid object: missing type')
-        if not isinstance(underlying['type'], str):
-            raise TypeError(
-                f'type must be str but {type(underlying["type"])}',
-            )
-        if (
-            'published' in underlying
-            and not isinstance(underlying['published'], str)
-        ):
-            raise TypeError(
-                f'published must be str but {type(underlying["published"])}',
-            )
-        if 'to' in underlying and not is_str_or_strs(underlying['to']):
-            raise TypeError(f'to must be str(s) but {type(underlying["to"])}')
-        if 'cc' in underlying and not is_str_or_strs(underlying['cc']):
-            raise TypeError(f'cc must be str(s) but {type(underlying["cc"])}')
-        if 'bcc' in underlying and not is_str_or_strs(underlying["bcc"]):
-            raise TypeError(
-                f'bcc must be str(s) but {type(underlying["bcc"])}',
-            )
-        if 'inReplyTo' in underlying:
-            Reference(underlying['inReplyTo'])
+        if not isinstance(type_, str):
+            raise TypeError(f'type must be str but {type(type_)}')
+        published = get('published', MISSING)
+        if published is not MISSING and not isinstance(published, str):
+            raise TypeError(f'published must be str but {type(published)}')
+        for field in ('to', 'cc', 'bcc'):
+            targets = get(field, MISSING)
+            if targets is not MISSING and not is_str_or_strs(targets):
+                raise TypeError(
+                    f'{field} must be str(s) but {type(targets)}',
+                )
+        in_reply_to = get('inReplyTo', MISSING)
+        if in_reply_to is not MISSING:
+            Reference.validate(in_reply_to)
         self._underlying = underlying
+        self._type = type_
 
     def set_jsonld_context(self, context: str):
         """Sets the JSON+LD context ("@context").
@@ -189,7 +194,7 @@ class DictObject(APObject):
 
     @property
     def type(self) -> str:
-        return self._underlying['type']
+        return self._type
 
     @property
     def published(self) -> str:
@@ -269,6 +274,16 @@ class DictObject(APObject):
         del underlying['@context']
         return underlying
 
+    def is_public(self) -> bool:
+        # reads the underlying dict directly, because ``hasattr`` on a missing
+        # ``to`` or ``cc`` raises and catches ``AttributeError``
+        get = self._underlying.get
+        for field in ('to', 'cc'):
+            addresses = get(field)
+            if addresses is not None and contains_public_address(addresses):
+                return True
+        return False
+
     @staticmethod
     def resolve(obj: Union[str, Dict[str, Any]]) -> 'DictObject':
         """Resolves an object.
@@ -298,6 +313,8 @@ class DictObject(APObject):
 class Link(DictObject):
     """Wraps a link object.
     """
+    __slots__ = ()
+
     def __init__(self, underlying: Dict[str, Any]):
         """Wraps a given ``dict``.
 
@@ -327,14 +344,21 @@ class ObjectStore:
     """Stores objects.
 
     Works as a dictionary of ActivityPub objects.
+
+    Thread-safe.
     """
+    __slots__ = ('_dict', '_lock')
+
     _dict: Dict[str, APObject]
     """Maps an object ID to the instance."""
+    _lock: Lock
+    """Lock that guards updates of ``_dict``."""
 
     def __init__(self, objects: Iterable[APObject]):
         """Initializes with already resolved objects.
         """
         self._dict = { o.id: o for o in objects }
+        self._lock = Lock()
 
     def get(self, id_: str) -> Optional[APObject]:
         """Obtains the object associated with a given ID in this store.
@@ -346,14 +370,19 @@ class ObjectStore:
 
         :raises AttributeError: if ``obj`` has no ID.
         """
-        self._dict[obj.id] = obj
+        with self._lock:
+            self._dict[obj.id] = obj
 
 
 class Reference:
     """Reference to an object.
     """
+    __slots__ = ('ref', '_id')
+
     ref: Union[str, Dict[str, Any]]
     """Reference to an object."""
+    _id: str
+    """ID of the referenced object determined at construction."""
 
     def __init__(self, ref: Union[str, Dict[str, Any]]):
         """Wraps a reference to an object.
@@ -369,30 +398,58 @@ class Reference:
         :raises TypeError: if ``ref`` is a "Link" but has a non-str ``href``,
         or if ``ref`` is an object itself but has a non-str ``id``.
         """
-        if not isinstance(ref, str):
-            if 'type' not in ref:
-                raise ValueError('dict ref must have type')
-            if ref['type'] == 'Link':
-                if 'href' not in ref:
-                    raise ValueError('link ref must have href')
-                if not isinstance(ref['href'], str):
-                    raise TypeError('href must be str but {type(ref["href"])}')
-            else:
-                if 'id' not in ref:
-                    raise ValueError('object must have id')
-                if not isinstance(ref['id'], str):
-                    raise TypeError('id must be str but {type(ref["id"])}')
+        Reference.validate(ref)
         self.ref = ref
+        if isinstance(ref, str):
+            self._id = ref
+        elif ref['type'] == 'Link':
+            self._id = ref['href']
+        else:
+            self._id = ref['id']
+
+    @staticmethod
+    def validate(ref: Union[str, Dict[str, Any]]):
+        """Validates a given reference without wrapping it.
+
+        :raises ValueError: if ``ref`` is invalid; see ``Reference``.
+
+        :raises TypeError: if ``ref`` is invalid; see ``Reference``.
+        """
+        if isinstance(ref, str):
+            return
+        if 'type' not in ref:
+            raise ValueError('dict ref must have type')
+        if ref['type'] == 'Link':
+            if 'href' not in ref:
+                raise ValueError('link ref must have href')
+            if not isinstance(ref['href'], str):
+                raise TypeError('href must be str but {type(ref["href"])}')
+        else:
+            if 'id' not in ref:
+                raise ValueError('object must have id')
+            if not isinstance(ref['id'], str):
+                raise TypeError('id must be str but {type(ref["id"])}')
+
+    @staticmethod
+    def get_id(ref: Union[str, Dict[str, Any]]) -> str:
+        """Obtains the ID of the object referenced by a given reference.
+
+        Returns a URI, the most common form, as it is without wrapping it.
+        Otherwise, works the same as ``Reference(ref).id``.
+
+        :raises ValueError: if ``ref`` is invalid; see ``Reference``.
+
+        :raises TypeError: if ``ref`` is invalid; see ``Reference``.
+        """
+        if isinstance(ref, str):
+            return ref
+        return Reference(ref).id
 
     @property
     def id(self) -> str: # pylint: disable=invalid-name
         """ID of the object.
         """
-        if isinstance(self.ref, str):
-            return self.ref
-        if self.ref['type'] == 'Link':
-            return self.ref['href']
-        return self.ref['id']
+        return self._id
 
     def is_embedded(self) -> bool:
         """Returns if the object is embedded.
@@ -432,3 +489,11 @@ def generate_id() -> str:
     "00000000-0000-0000-0000-00000000".
     """
     return str(uuid7())
+
+
+def contains_public_address(addresses: Union[str, List[str]]) -> bool:
+    """Returns if given addresses contain the ActivityStreams' public address.
+    """
+    if isinstance(addresses, str):
+        return addresses == ACTIVITY_STREAMS_PUBLIC_ADDRESS
+    return ACTIVITY_STREAMS_PUBLIC_ADDRESS in addresses
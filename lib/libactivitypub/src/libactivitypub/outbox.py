@@ -3,20 +3,22 @@
 """Provides access to outbox.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional
 from .activity import Activity
 from .activity_streams import get as activity_streams_get
 from .collection import resolve_collection_page
 
 
 LOGGER = logging.getLogger('libactivitypub.outbox')
-LOGGER.setLevel(logging.DEBUG)
 
 
 class Outbox:
     """Wraps an outbox.
     """
+    __slots__ = ('outbox_uri',)
+
     def __init__(self, outbox_uri: str):
         """Initializes with a given outbox URI.
         """
@@ -25,6 +27,8 @@ class Outbox:
     def __iter__(self) -> Generator[Activity, None, None]:
         """Iterates over activities in the outbox.
 
+        Prefetches the next page while items in the current page are consumed.
+
         :raises requests.HTTPError: if an HTTP request fails.
         """
         LOGGER.debug('pulling outbox collection: %s', self.outbox_uri)
@@ -39,14 +43,26 @@ class Outbox:
             next_page = page_data.get('next')
         # yields each item until all the items are exhausted
         current_page = 1
-        while items is not None:
-            for item in items:
-                yield Activity.parse_object(item)
-            # resolves the next page if exists
-            if next_page is None:
-                break
-            current_page += 1
-            LOGGER.debug('pulling the page[%d]: %s', current_page, next_page)
-            page_data = resolve_collection_page(next_page)
-            items = page_data.get('items') or page_data.get('orderedItems')
-            next_page = page_data.get('next')
+        parse = Activity.parse_object
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while items is not None:
+                next_page_data: Optional[Future[Dict[str, Any]]] = None
+                if next_page is not None:
+                    LOGGER.debug(
+                        'prefetching the page[%d]: %s',
+                        current_page + 1,
+                        next_page,
+                    )
+                    next_page_data = executor.submit(
+                        resolve_collection_page,
+                        next_page,
+                    )
+                for item in items:
+                    yield parse(item)
+                # waits for the next page if exists
+                if next_page_data is None:
+                    break
+                current_page += 1
+                page_data = next_page_data.result()
+                items = page_data.get('items') or page_data.get('orderedItems')
+                next_page = page_data.get('next')
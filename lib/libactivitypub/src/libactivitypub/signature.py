@@ -12,6 +12,7 @@ References:
 import base64
 from datetime import datetime
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 import hashlib
 import logging
 import math
@@ -24,7 +25,6 @@ import pytz
 
 
 LOGGER = logging.getLogger('libactivitypub.signature')
-LOGGER.setLevel(logging.DEBUG)
 
 DEFAULT_SIGNING_ALGORITHM = 'rsa-sha256'
 """Default algorithm for signing, formally called RSASSA-PKCS1-v1_5."""
@@ -172,6 +172,23 @@ def concatenate_headers(
     return '\n'.join(lines)
 
 
+@lru_cache(maxsize=256)
+def import_public_key(public_key_pem: str) -> RSA.RsaKey:
+    """Imports an RSA public key from a given PEM.
+
+    Memoized because decoding a key costs far more than verifying short
+    header strings, and the same senders sign requests repeatedly.
+    Never pass a private key, which must not stay in a process-wide cache.
+
+    :raises ValueError: if ``public_key_pem`` is invalid.
+
+    :raises IndexError: if ``public_key_pem`` is invalid.
+
+    :raises TypeError: if ``public_key_pem`` is invalid.
+    """
+    return RSA.import_key(public_key_pem)
+
+
 def verify_headers(
     headers: Iterable[str],
     header_values: Dict[str, str],
@@ -192,7 +209,7 @@ def verify_headers(
     LOGGER.debug('message to verify: %s', message)
     signature_bytes = base64.b64decode(signature)
     try:
-        rsa_key = RSA.import_key(public_key_pem)
+        rsa_key = import_public_key(public_key_pem)
     except (IndexError, TypeError, ValueError) as exc:
         raise VerificationError(f'invalid public key: {exc}') from exc
     hashed = SHA256.new(message.encode('utf-8'))
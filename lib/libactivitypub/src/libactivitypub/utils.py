@@ -14,16 +14,16 @@ def parse_webfinger_id(account: str) -> Tuple[str, str]:
 
     :returns: tuple of the account and domain name.
 
-    :raises ValueError: if ``account`` does not contain an atmark ('@').
+    :raises ValueError: if ``account`` does not contain an atmark ('@'),
+    or if the name or domain name is empty.
     """
-    try:
-        name, domain = account.split('@', maxsplit=1)
-        return name, domain
-    except ValueError as exc:
+    name, atmark, domain = account.partition('@')
+    if not atmark or not name or not domain:
         raise ValueError(
             'WebFinger ID must be in the form "<name>@<domain-name>";'
             f' e.g., "gargron@mastodon.social": {account}',
-        ) from exc
+        )
+    return name, domain
 
 
 def parse_acct_uri(uri: str) -> Tuple[str, str]:
@@ -47,6 +47,12 @@ def is_str_or_strs(value: Any) -> bool:
     """
     if isinstance(value, str):
         return True
+    if type(value) is list: # pylint: disable=unidiomatic-typecheck
+        # fast path for what JSON arrays decode into
+        for item in value:
+            if not isinstance(item, str):
+                return False
+        return True
     return is_sequence_of(value, lambda s: isinstance(s, str))
 
 
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""Tests ``libactivitypub.activity``.
+"""
+
+from typing import Any, Dict, List, Union
+from libactivitypub.activity import (
+    FAILED_RESOLUTIONS,
+    Follow,
+    MessageActivity,
+    RESOLVED_OBJECTS,
+    RecentlyFailedError,
+    get_error_status_code,
+    resolve_cached,
+    resolve_reference,
+)
+from libactivitypub.objects import DictObject, ObjectStore, Reference
+import pytest
+import requests
+
+
+class FailingResolver:
+    """Fake of ``DictObject.resolve`` that fails with a given HTTP status.
+    """
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.requested: List[Union[str, Dict[str, Any]]] = []
+
+    def __call__(self, obj: Union[str, Dict[str, Any]]) -> DictObject:
+        self.requested.append(obj)
+        res = requests.Response()
+        res.status_code = self.status_code
+        raise requests.HTTPError(f'{self.status_code}', response=res)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Clears the caches of resolved objects before and after each test.
+    """
+    RESOLVED_OBJECTS.clear()
+    FAILED_RESOLUTIONS.clear()
+    yield
+    RESOLVED_OBJECTS.clear()
+    FAILED_RESOLUTIONS.clear()
+
+
+def use_resolver(monkeypatch, resolver: FailingResolver):
+    """Replaces ``DictObject.resolve`` with a given resolver.
+    """
+    monkeypatch.setattr(
+        'libactivitypub.activity.DictObject.resolve',
+        staticmethod(resolver),
+    )
+
+
+def test_resolve_cached_reuses_recent_failure(monkeypatch):
+    """Tests ``resolve_cached`` fails without a request if the resolution
+    failed recently.
+    """
+    resolver = FailingResolver(404)
+    use_resolver(monkeypatch, resolver)
+    obj_ref = Reference('https://example.com/notes/1')
+    with pytest.raises(requests.HTTPError) as first:
+        resolve_cached(obj_ref)
+    assert not isinstance(first.value, RecentlyFailedError)
+    with pytest.raises(RecentlyFailedError) as second:
+        resolve_cached(obj_ref)
+    assert second.value.status_code == 404
+    assert second.value.response is None
+    assert get_error_status_code(second.value) == 404
+    with pytest.raises(RecentlyFailedError) as third:
+        resolve_cached(obj_ref)
+    assert third.value is not second.value
+    assert resolver.requested == ['https://example.com/notes/1']
+
+
+def test_resolve_cached_does_not_remember_transient_failure(monkeypatch):
+    """Tests ``resolve_cached`` makes a request again if the last resolution
+    failed with a status that is not negatively cached.
+    """
+    resolver = FailingResolver(503)
+    use_resolver(monkeypatch, resolver)
+    obj_ref = Reference('https://example.com/notes/1')
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError) as exc_info:
+            resolve_cached(obj_ref)
+        assert not isinstance(exc_info.value, RecentlyFailedError)
+    assert len(resolver.requested) == 2
+
+
+def test_resolve_reference_ignores_recent_unauthorized_failure(monkeypatch):
+    """Tests ``resolve_reference`` ignores an unauthorized (401) failure
+    reused from the recent resolution.
+    """
+    resolver = FailingResolver(401)
+    use_resolver(monkeypatch, resolver)
+    obj_ref = Reference('https://example.com/notes/1')
+    assert resolve_reference(obj_ref, ObjectStore([])) is None
+    assert resolve_reference(obj_ref, ObjectStore([])) is None
+    assert len(resolver.requested) == 1
+
+
+def test_activity_does_not_replace_underlying_type():
+    """Tests an activity interns its type without replacing the type in the
+    given ``dict``.
+    """
+    activity_type = ''.join(['Fol', 'low'])
+    underlying = {
+        'id': 'https://example.com/activities/1',
+        'type': activity_type,
+        'actor': 'https://example.com/users/alice',
+        'object': 'https://example.com/users/bob',
+    }
+    activity = Follow(underlying)
+    assert activity.type == 'Follow'
+    assert underlying['type'] is activity_type
+
+
+@pytest.mark.parametrize('targets', [
+    'https://example.com/users/alice',
+    ['https://example.com/users/alice'],
+])
+def test_resolve_targets_ignores_unauthorized_target(monkeypatch, targets):
+    """Tests ``MessageActivity.resolve_targets`` ignores an unauthorized
+    (401) target whether given a single target or a list.
+    """
+    use_resolver(monkeypatch, FailingResolver(401))
+    object_store = ObjectStore([])
+    MessageActivity.resolve_targets(targets, object_store)
+    assert object_store.get('https://example.com/users/alice') is None
+
+
+@pytest.mark.parametrize('targets', [
+    'https://example.com/users/alice',
+    ['https://example.com/users/alice'],
+])
+def test_resolve_targets_raises_other_failure(monkeypatch, targets):
+    """Tests ``MessageActivity.resolve_targets`` propagates a failure other
+    than unauthorized (401) whether given a single target or a list.
+    """
+    use_resolver(monkeypatch, FailingResolver(404))
+    with pytest.raises(requests.HTTPError):
+        MessageActivity.resolve_targets(targets, ObjectStore([]))
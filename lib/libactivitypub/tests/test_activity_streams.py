@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""Tests ``libactivitypub.activity_streams``.
+"""
+
+from typing import Any, Dict, List, Optional
+from libactivitypub import activity_streams
+from libactivitypub.activity_streams import (
+    CACHED_DOCUMENTS,
+    MAX_RETRY_BACKOFF,
+    BoundedRetry,
+    get,
+)
+import orjson
+import pytest
+
+
+class FakeResponse:
+    """Fake of ``requests.Response``.
+    """
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, str],
+        body: Optional[Dict[str, Any]]=None,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = orjson.dumps(body) if body is not None else b''
+
+    def raise_for_status(self):
+        """Does nothing.
+        """
+
+
+class FakeSession:
+    """Fake of ``requests.Session`` that returns prepared responses.
+    """
+    def __init__(self, responses: List[FakeResponse]):
+        self.responses = responses
+        self.requests: List[Dict[str, str]] = []
+
+    def get(self, endpoint: str, headers: Dict[str, str], timeout: float): # pylint: disable=unused-argument
+        """Records ``headers`` and returns the next response.
+        """
+        self.requests.append(headers)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def clear_cache():
+    """Clears ``CACHED_DOCUMENTS`` before and after a test.
+    """
+    CACHED_DOCUMENTS.clear()
+    yield
+    CACHED_DOCUMENTS.clear()
+
+
+def test_get_revalidates_document_with_etag(monkeypatch, clear_cache): # pylint: disable=unused-argument,redefined-outer-name
+    """Tests ``get`` reuses a document revalidated by 304.
+    """
+    body = { 'id': 'https://example.com/users/a' }
+    session = FakeSession([
+        FakeResponse(200, { 'ETag': '"v1"' }, body),
+        FakeResponse(304, {}),
+    ])
+    monkeypatch.setattr(activity_streams, 'HTTP_SESSION', session)
+    first = get('https://example.com/users/a')
+    assert first == body
+    assert get('https://example.com/users/a') == body
+    assert 'If-None-Match' not in session.requests[0]
+    assert session.requests[1]['If-None-Match'] == '"v1"'
+
+
+def test_get_uses_fresh_document_without_request(monkeypatch, clear_cache): # pylint: disable=unused-argument,redefined-outer-name
+    """Tests ``get`` makes no request while a document is fresh.
+    """
+    body = { 'id': 'https://example.com/users/a' }
+    session = FakeSession([
+        FakeResponse(200, { 'Cache-Control': 'max-age=60' }, body),
+    ])
+    monkeypatch.setattr(activity_streams, 'HTTP_SESSION', session)
+    first = get('https://example.com/users/a')
+    assert first == body
+    assert get('https://example.com/users/a') == body
+    assert len(session.requests) == 1
+
+
+def test_get_does_not_share_cached_document(monkeypatch, clear_cache): # pylint: disable=unused-argument,redefined-outer-name
+    """Tests ``get`` returns a cached document that is not affected by
+    changes on a previously returned one.
+    """
+    body = { 'id': 'https://example.com/users/a', 'type': 'Person' }
+    session = FakeSession([
+        FakeResponse(200, { 'Cache-Control': 'max-age=60' }, body),
+    ])
+    monkeypatch.setattr(activity_streams, 'HTTP_SESSION', session)
+    first = get('https://example.com/users/a')
+    first['type'] = 'Service'
+    assert get('https://example.com/users/a') == body
+
+
+def test_get_does_not_cache_no_store_document(monkeypatch, clear_cache): # pylint: disable=unused-argument,redefined-outer-name
+    """Tests ``get`` does not cache a document with "no-store".
+    """
+    body = { 'id': 'https://example.com/users/a' }
+    session = FakeSession([
+        FakeResponse(
+            200,
+            { 'Cache-Control': 'no-store', 'ETag': '"v1"' },
+            body,
+        ),
+        FakeResponse(200, {}, body),
+    ])
+    monkeypatch.setattr(activity_streams, 'HTTP_SESSION', session)
+    get('https://example.com/users/a')
+    get('https://example.com/users/a')
+    assert 'If-None-Match' not in session.requests[1]
+
+
+def test_bounded_retry_caps_backoff():
+    """Tests ``BoundedRetry`` never sleeps longer than ``MAX_RETRY_BACKOFF``
+    even after many retries.
+    """
+    retry = BoundedRetry(total=10, backoff_factor=1.0)
+    for _ in range(8):
+        retry = retry.increment(method='GET', url='/')
+    assert retry.get_backoff_time() == MAX_RETRY_BACKOFF
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""Tests ``libactivitypub.cache``.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+from libactivitypub.cache import TtlLruCache
+import pytest
+
+
+class Clock:
+    """Fake of ``time.monotonic``.
+    """
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    """Replaces ``time.monotonic`` used in ``libactivitypub.cache``.
+    """
+    fake = Clock()
+    monkeypatch.setattr('libactivitypub.cache.time.monotonic', fake)
+    return fake
+
+
+def test_ttl_lru_cache_get_put(clock):
+    """Tests ``TtlLruCache`` returns a value put within the TTL.
+    """
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    cache.put('a', 1)
+    clock.now = 9.9
+    assert cache.get('a') == 1
+
+
+def test_ttl_lru_cache_get_missing_key(clock): # pylint: disable=unused-argument
+    """Tests ``TtlLruCache`` returns ``None`` for a missing key.
+    """
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    assert cache.get('a') is None
+
+
+def test_ttl_lru_cache_expires_value(clock):
+    """Tests ``TtlLruCache`` expires a value after the TTL.
+    """
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    cache.put('a', 1)
+    clock.now = 10.0
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_ttl_lru_cache_remove(clock): # pylint: disable=unused-argument
+    """Tests ``TtlLruCache`` removes a value, and ignores a missing key.
+    """
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    cache.put('a', 1)
+    cache.remove('a')
+    cache.remove('b')
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_ttl_lru_cache_evicts_least_recently_used(clock): # pylint: disable=unused-argument
+    """Tests ``TtlLruCache`` evicts the least recently used entry when it is
+    full.
+    """
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_ttl_lru_cache_with_non_positive_max_size():
+    """Tests ``TtlLruCache`` with a non-positive ``max_size``.
+    """
+    with pytest.raises(ValueError):
+        TtlLruCache(max_size=0, ttl=10.0)
+
+
+def test_ttl_lru_cache_get_or_load_caches_loaded_value(clock): # pylint: disable=unused-argument
+    """Tests ``TtlLruCache.get_or_load`` loads a missing value only once.
+    """
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    loads = []
+    def load():
+        loads.append('a')
+        return 1
+    assert cache.get_or_load('a', load) == 1
+    assert cache.get_or_load('a', load) == 1
+    assert loads == ['a']
+
+
+def test_ttl_lru_cache_get_or_load_shares_concurrent_load(monkeypatch):
+    """Tests ``TtlLruCache.get_or_load`` shares a single load among
+    concurrent callers.
+    """
+    waiting = threading.Event()
+    class ObservedFuture(Future):
+        """``Future`` that tells when a caller starts waiting for it.
+        """
+        def exception(self, timeout=None):
+            waiting.set()
+            return super().exception(timeout=timeout)
+    monkeypatch.setattr('libactivitypub.cache.Future', ObservedFuture)
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    started = threading.Event()
+    release = threading.Event()
+    loads = []
+    def load():
+        loads.append('a')
+        started.set()
+        release.wait(timeout=5.0)
+        return 1
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(cache.get_or_load, 'a', load)
+        assert started.wait(timeout=5.0)
+        second = executor.submit(cache.get_or_load, 'a', load)
+        # the second caller must wait for the first load still in progress
+        assert waiting.wait(timeout=5.0)
+        assert not first.done()
+        release.set()
+        assert first.result() == 1
+        assert second.result() == 1
+    assert loads == ['a']
+
+
+def test_ttl_lru_cache_get_or_load_does_not_cache_error(clock): # pylint: disable=unused-argument
+    """Tests ``TtlLruCache.get_or_load`` does not cache a failed load.
+    """
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    def load():
+        raise RuntimeError('failed')
+    with pytest.raises(RuntimeError):
+        cache.get_or_load('a', load)
+    assert cache.get_or_load('a', lambda: 1) == 1
+
+
+def test_ttl_lru_cache_get_or_load_copies_error_for_waiter(monkeypatch):
+    """Tests ``TtlLruCache.get_or_load`` raises a copy of the error of a
+    shared load in a waiting caller.
+    """
+    waiting = threading.Event()
+    class ObservedFuture(Future):
+        """``Future`` that tells when a caller starts waiting for it.
+        """
+        def exception(self, timeout=None):
+            waiting.set()
+            return super().exception(timeout=timeout)
+    monkeypatch.setattr('libactivitypub.cache.Future', ObservedFuture)
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    started = threading.Event()
+    release = threading.Event()
+    def load():
+        started.set()
+        release.wait(timeout=5.0)
+        raise RuntimeError('failed')
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(cache.get_or_load, 'a', load)
+        assert started.wait(timeout=5.0)
+        second = executor.submit(cache.get_or_load, 'a', load)
+        assert waiting.wait(timeout=5.0)
+        release.set()
+        original = first.exception(timeout=5.0)
+        copied = second.exception(timeout=5.0)
+    assert isinstance(original, RuntimeError)
+    assert isinstance(copied, RuntimeError)
+    assert copied is not original
+    assert copied.args == original.args
+    assert copied.__cause__ is original
+
+
+def test_ttl_lru_cache_configure(clock):
+    """Tests ``TtlLruCache.configure``.
+    """
+    cache = TtlLruCache(max_size=3, ttl=10.0)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    cache.configure(max_size=2, ttl=20.0)
+    assert cache.max_size == 2
+    assert cache.ttl == 20.0
+    assert len(cache) == 2
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    cache.put('d', 4)
+    clock.now = 15.0
+    assert cache.get('b') is None
+    assert cache.get('d') == 4
+
+
+def test_ttl_lru_cache_configure_with_invalid_arguments():
+    """Tests ``TtlLruCache.configure`` with invalid arguments.
+    """
+    cache = TtlLruCache(max_size=2, ttl=10.0)
+    with pytest.raises(ValueError):
+        cache.configure(max_size=0, ttl=10.0)
+    with pytest.raises(ValueError):
+        cache.configure(max_size=2, ttl=-1.0)
+    assert cache.max_size == 2
+    assert cache.ttl == 10.0
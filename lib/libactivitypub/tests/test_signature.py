@@ -8,6 +8,7 @@ from email.utils import format_datetime
 from libactivitypub.signature import (
     VerificationError,
     digest_request_body,
+    import_public_key,
     is_valid_request_body,
     is_valid_signature_date,
     make_signature_header,
@@ -397,6 +398,21 @@ def test_sign_headers():
     assert sign_headers(headers, header_values, private_key_pem) == signature
 
 
+def test_sign_headers_does_not_cache_private_key():
+    """Tests ``sign_headers`` does not leave the private key in the cache of
+    ``import_public_key``.
+    """
+    headers = ['(request-target)', 'host', 'date']
+    header_values = {
+        '(request-target)': 'post /users/kemoto/inbox',
+        'host': 'mumble.codemonger.io',
+        'date': 'Wed, 26 Apr 2023 11:32:00 GMT',
+    }
+    import_public_key.cache_clear()
+    sign_headers(headers, header_values, PRIVATE_KEY_PEM_1)
+    assert import_public_key.cache_info().currsize == 0
+
+
 def test_sign_headers_with_public_key():
     """Tests ``sign_headers`` with a public key.
     """
@@ -27,6 +27,22 @@ def test_parse_webfinger_id_without_atmark():
         parse_webfinger_id('gargron')
 
 
+def test_parse_webfinger_id_with_empty_name():
+    """Tests ``parse_webfinger_id`` with an account name without the name
+    ("@mastodon.social").
+    """
+    with pytest.raises(ValueError):
+        parse_webfinger_id('@mastodon.social')
+
+
+def test_parse_webfinger_id_with_empty_domain_name():
+    """Tests ``parse_webfinger_id`` with an account name without the domain
+    name ("gargron@").
+    """
+    with pytest.raises(ValueError):
+        parse_webfinger_id('gargron@')
+
+
 def test_parse_acct_uri_with_valid_uri():
     """Tests ``parse_acct_uri`` with a valid URI
     ("acct:gargron@mastodon.social").